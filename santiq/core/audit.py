@@ -1,10 +1,12 @@
 """Audit logging and tracking for ETL operations."""
 
 import json
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from pydantic import BaseModel
 
@@ -29,6 +31,9 @@ class AuditLogger:
 
     def __init__(self, log_file: Optional[str] = None) -> None:
         self.log_file = Path(log_file) if log_file else self._get_default_log_file()
+        self._write_lock = threading.Lock()
+        self._batch_depth = 0
+        self._pending_lines: List[str] = []
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Ensure log file exists (but don't initialize with content)
@@ -71,12 +76,40 @@ class AuditLogger:
             error_message=error_message,
         )
 
-        # Append to JSONL file
-        with open(self.log_file, "a") as f:
-            f.write(event.model_dump_json() + "\n")
+        # Append to JSONL file; the lock keeps lines whole when plugins run
+        # on worker threads
+        line = event.model_dump_json() + "\n"
+        with self._write_lock:
+            if self._batch_depth:
+                self._pending_lines.append(line)
+            else:
+                self._append_lines([line])
 
         return event.id
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer events logged inside the block and append them in one write.
+
+        Batches may be nested; buffered events are written when the outermost
+        block exits, including when it exits with an exception.
+        """
+        with self._write_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._write_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._pending_lines:
+                    lines, self._pending_lines = self._pending_lines, []
+                    self._append_lines(lines)
+
+    def _append_lines(self, lines: List[str]) -> None:
+        """Append serialized event lines to the log file."""
+        with open(self.log_file, "a") as f:
+            f.write("".join(lines))
+
     def get_pipeline_events(self, pipeline_id: str) -> List[AuditEvent]:
         """Get all events for a specific pipeline."""
         events: List[AuditEvent] = []
@@ -112,3 +145,45 @@ class AuditLogger:
                     continue
 
         return sorted(events, key=lambda e: e.timestamp, reverse=True)[:limit]
+
+    def get_pipeline_events_as_dict(self, pipeline_id: str) -> List[Dict[str, Any]]:
+        """Get all events for a specific pipeline as raw dictionaries.
+
+        Skips AuditEvent validation and serialization for read-only callers.
+        Timestamps are returned as the ISO strings stored in the log.
+        """
+        events = [
+            event
+            for event in self._read_raw_events()
+            if event.get("pipeline_id") == pipeline_id
+        ]
+        return sorted(events, key=lambda e: e["timestamp"])
+
+    def get_recent_events_as_dict(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get the most recent audit events as raw dictionaries.
+
+        Skips AuditEvent validation and serialization for read-only callers.
+        Timestamps are returned as the ISO strings stored in the log.
+        """
+        events = self._read_raw_events()
+        return sorted(events, key=lambda e: e["timestamp"], reverse=True)[:limit]
+
+    def _read_raw_events(self) -> List[Dict[str, Any]]:
+        """Read every well-formed event line from the log file."""
+        events: List[Dict[str, Any]] = []
+
+        if not self.log_file.exists():
+            return events
+
+        with open(self.log_file) as f:
+            for line in f:
+                try:
+                    event_data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(event_data, dict) and isinstance(
+                    event_data.get("timestamp"), str
+                ):
+                    events.append(event_data)
+
+        return events
@@ -101,8 +101,7 @@ class ETLEngine:
         Raises:
             ETLError: If pipeline execution fails
         """
-        config = self.config_manager.load_pipeline_config(config_path)
-        return self.pipeline.execute(config, mode, pipeline_id)
+        return self.run_pipeline(config_path, mode, pipeline_id)
 
     def list_plugins(
         self, plugin_type: Optional[str] = None
@@ -211,8 +210,7 @@ class ETLEngine:
         Returns:
             List of pipeline execution events
         """
-        events = self.audit_logger.get_pipeline_events(pipeline_id)
-        return [event.model_dump() for event in events]
+        return self.audit_logger.get_pipeline_events_as_dict(pipeline_id)
 
     def get_recent_executions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent pipeline executions.
@@ -223,9 +221,8 @@ class ETLEngine:
         Returns:
             List of recent pipeline execution events
         """
-        events = self.audit_logger.get_recent_events(limit)
-        pipeline_events = [e for e in events if e.event_type == "pipeline_start"]
-        return [event.model_dump() for event in pipeline_events]
+        events = self.audit_logger.get_recent_events_as_dict(limit)
+        return [e for e in events if e.get("event_type") == "pipeline_start"]
 
     def get_audit_log(
         self, pipeline_id: Optional[str] = None, limit: int = 100
@@ -240,8 +237,6 @@ class ETLEngine:
             List of audit events as dictionaries
         """
         if pipeline_id:
-            events = self.audit_logger.get_pipeline_events(pipeline_id)
-        else:
-            events = self.audit_logger.get_recent_events(limit)
+            return self.audit_logger.get_pipeline_events_as_dict(pipeline_id)
 
-        return [event.model_dump() for event in events]
+        return self.audit_logger.get_recent_events_as_dict(limit)
@@ -2,16 +2,23 @@
 
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
 
 import pandas as pd
 
 from santiq.core.audit import AuditLogger
-from santiq.core.config import ConfigManager, PipelineConfig
+from santiq.core.config import ConfigManager, PipelineConfig, PluginConfig
 from santiq.core.exceptions import PipelineExecutionError
 from santiq.core.plugin_manager import PluginManager
-from santiq.plugins.base.profiler import ProfileResult
+from santiq.plugins.base.extractor import ExtractorPlugin
+from santiq.plugins.base.loader import LoaderPlugin
+from santiq.plugins.base.profiler import ProfileResult, ProfilerPlugin
+from santiq.plugins.base.transformer import TransformerPlugin
+
+T = TypeVar("T")
 
 
 class PipelineContext:
@@ -71,26 +78,30 @@ class Pipeline:
             )
 
             # Execute extraction
-            context.data = self._execute_extraction(context)
+            with self.audit_logger.batch():
+                context.data = self._execute_extraction(context)
 
             # Execute profiling
             if config.profilers:
-                context.profile_results = self._execute_profiling(context)
+                with self.audit_logger.batch():
+                    context.profile_results = self._execute_profiling(context)
 
             # Execute transformations
             if config.transformers:
-                context.data = self._execute_transformations(context, mode)
+                with self.audit_logger.batch():
+                    context.data = self._execute_transformations(context, mode)
 
             # Execute loading
-            load_results = self._execute_loading(context)
+            with self.audit_logger.batch():
+                load_results = self._execute_loading(context)
+
+            rows_processed = len(context.data) if context.data is not None else 0
 
             self.audit_logger.log_event(
                 "pipeline_complete",
                 pipeline_id,
                 data={
-                    "rows_processed": (
-                        len(context.data) if context.data is not None else 0
-                    ),
+                    "rows_processed": rows_processed,
                     "fixes_applied": len(context.applied_fixes),
                     "load_results": load_results,
                 },
@@ -99,7 +110,7 @@ class Pipeline:
             return {
                 "pipeline_id": pipeline_id,
                 "success": True,
-                "rows_processed": len(context.data) if context.data is not None else 0,
+                "rows_processed": rows_processed,
                 "fixes_applied": context.applied_fixes,
                 "load_results": load_results,
                 "data": context.data,
@@ -119,8 +130,12 @@ class Pipeline:
         config = context.config.extractor
 
         try:
-            extractor = self.plugin_manager.create_plugin_instance(
-                config.plugin, "extractor", config.params
+            # Plugin classes are checked for their required method at discovery
+            extractor = cast(
+                ExtractorPlugin,
+                self.plugin_manager.create_plugin_instance(
+                    config.plugin, "extractor", config.params
+                ),
             )
 
             self.audit_logger.log_event(
@@ -131,12 +146,6 @@ class Pipeline:
                 plugin_type="extractor",
             )
 
-            # Ensure the extractor has the extract method
-            if not hasattr(extractor, "extract") or not callable(extractor.extract):
-                raise AttributeError(
-                    f"Plugin {config.plugin} does not have a callable 'extract' method"
-                )
-
             data = extractor.extract()
 
             self.audit_logger.log_event(
@@ -145,7 +154,7 @@ class Pipeline:
                 stage="extract",
                 plugin_name=config.plugin,
                 plugin_type="extractor",
-                data={"rows_extracted": len(data), "columns": list(data.columns)},
+                data={"rows_extracted": len(data), "columns": data.columns.tolist()},
             )
 
             return data
@@ -166,116 +175,111 @@ class Pipeline:
 
     def _execute_profiling(self, context: PipelineContext) -> List[ProfileResult]:
         """Execute profiling plugins."""
-        results = []
-
-        for profiler_config in context.config.profilers:
-            if not profiler_config.enabled:
-                continue
-
-            try:
-                profiler = self.plugin_manager.create_plugin_instance(
+        profiler_configs = [c for c in context.config.profilers if c.enabled]
+        results = self._run_stage_plugins(self._run_profiler, context, profiler_configs)
+        return [result for result in results if result is not None]
+
+    def _run_profiler(
+        self, context: PipelineContext, profiler_config: PluginConfig
+    ) -> Optional[ProfileResult]:
+        """Run a single profiler plugin, returning None if it failed."""
+        try:
+            profiler = cast(
+                ProfilerPlugin,
+                self.plugin_manager.create_plugin_instance(
                     profiler_config.plugin, "profiler", profiler_config.params
-                )
-
-                self.audit_logger.log_event(
-                    "plugin_start",
-                    context.pipeline_id,
-                    stage="profile",
-                    plugin_name=profiler_config.plugin,
-                    plugin_type="profiler",
-                )
+                ),
+            )
 
-                # Ensure the profiler has the profile method
-                if not hasattr(profiler, "profile") or not callable(profiler.profile):
-                    raise AttributeError(
-                        f"Plugin {profiler_config.plugin} does not have a callable 'profile' method"
-                    )
+            self.audit_logger.log_event(
+                "plugin_start",
+                context.pipeline_id,
+                stage="profile",
+                plugin_name=profiler_config.plugin,
+                plugin_type="profiler",
+            )
 
-                if context.data is None:
-                    raise ValueError("Cannot profile None data")
-                result = profiler.profile(context.data)
-                results.append(result)
+            if context.data is None:
+                raise ValueError("Cannot profile None data")
+            result = profiler.profile(context.data)
 
-                self.audit_logger.log_event(
-                    "plugin_complete",
-                    context.pipeline_id,
-                    stage="profile",
-                    plugin_name=profiler_config.plugin,
-                    plugin_type="profiler",
-                    data={
-                        "issues_found": len(result.issues),
-                        "suggestions": len(result.suggestions),
-                    },
-                )
+            self.audit_logger.log_event(
+                "plugin_complete",
+                context.pipeline_id,
+                stage="profile",
+                plugin_name=profiler_config.plugin,
+                plugin_type="profiler",
+                data={
+                    "issues_found": len(result.issues),
+                    "suggestions": len(result.suggestions),
+                },
+            )
 
-            except Exception as e:
-                if profiler_config.on_error == "stop":
-                    raise
+            return result
 
-                self.audit_logger.log_event(
-                    "plugin_error",
-                    context.pipeline_id,
-                    stage="profile",
-                    plugin_name=profiler_config.plugin,
-                    plugin_type="profiler",
-                    success=False,
-                    error_message=str(e),
-                )
-            finally:
-                self.plugin_manager.cleanup_plugin_instance(
-                    profiler_config.plugin, "profiler"
-                )
+        except Exception as e:
+            if profiler_config.on_error == "stop":
+                raise
 
-        return results
+            self.audit_logger.log_event(
+                "plugin_error",
+                context.pipeline_id,
+                stage="profile",
+                plugin_name=profiler_config.plugin,
+                plugin_type="profiler",
+                success=False,
+                error_message=str(e),
+            )
+            return None
+        finally:
+            self.plugin_manager.cleanup_plugin_instance(
+                profiler_config.plugin, "profiler"
+            )
 
     def _execute_transformations(
         self, context: PipelineContext, mode: str
     ) -> pd.DataFrame:
         """Execute transformation plugins."""
-        current_data = (
-            context.data.copy() if context.data is not None else pd.DataFrame()
+        # Transformers return a new frame in TransformResult.data, so the
+        # extracted frame is handed over without a defensive copy
+        current_data = context.data if context.data is not None else pd.DataFrame()
+        pipeline_id = context.pipeline_id
+        # Every transformer reports against the row count of the stage input
+        rows_before = len(current_data)
+
+        # Profile results do not change during this stage, so the issue list
+        # handed to suggest_fixes is flattened once for every transformer
+        relevant_issues = (
+            self._get_relevant_issues(context.profile_results)
+            if mode in ["manual", "half-auto"]
+            else []
         )
 
-        for transformer_config in context.config.transformers:
-            if not transformer_config.enabled:
-                continue
+        transformer_configs = [c for c in context.config.transformers if c.enabled]
 
+        for transformer_config in transformer_configs:
             try:
-                transformer = self.plugin_manager.create_plugin_instance(
-                    transformer_config.plugin, "transformer", transformer_config.params
+                transformer = cast(
+                    TransformerPlugin,
+                    self.plugin_manager.create_plugin_instance(
+                        transformer_config.plugin,
+                        "transformer",
+                        transformer_config.params,
+                    ),
                 )
 
                 self.audit_logger.log_event(
                     "plugin_start",
-                    context.pipeline_id,
+                    pipeline_id,
                     stage="transform",
                     plugin_name=transformer_config.plugin,
                     plugin_type="transformer",
                 )
 
-                # Ensure the transformer has the required methods
-                if not hasattr(transformer, "transform") or not callable(
-                    transformer.transform
-                ):
-                    raise AttributeError(
-                        f"Plugin {transformer_config.plugin} does not have a callable 'transform' method"
-                    )
-
-                if not hasattr(transformer, "suggest_fixes") or not callable(
-                    transformer.suggest_fixes
-                ):
-                    raise AttributeError(
-                        f"Plugin {transformer_config.plugin} does not have a callable 'suggest_fixes' method"
-                    )
-
                 # Get suggestions if in interactive mode
                 if mode in ["manual", "half-auto"]:
-                    # Type assertion since we know this is a transformer plugin
-                    from santiq.plugins.base.transformer import TransformerPlugin
-
-                    transformer_plugin = transformer
-                    suggestions = transformer_plugin.suggest_fixes(  # type: ignore[union-attr]
-                        current_data, self._get_relevant_issues(context.profile_results)
+                    suggestions = transformer.suggest_fixes(
+                        current_data, relevant_issues
                     )
                     if mode == "manual":
                         # In manual mode, user would review suggestions via CLI/UI
@@ -293,14 +297,12 @@ class Pipeline:
 
                 self.audit_logger.log_event(
                     "plugin_complete",
-                    context.pipeline_id,
+                    pipeline_id,
                     stage="transform",
                     plugin_name=transformer_config.plugin,
                     plugin_type="transformer",
                     data={
-                        "rows_before": (
-                            len(context.data) if context.data is not None else 0
-                        ),
+                        "rows_before": rows_before,
                         "rows_after": len(current_data),
                         "fixes_applied": len(result.applied_fixes),
                     },
@@ -312,7 +314,7 @@ class Pipeline:
 
                 self.audit_logger.log_event(
                     "plugin_error",
-                    context.pipeline_id,
+                    pipeline_id,
                     stage="transform",
                     plugin_name=transformer_config.plugin,
                     plugin_type="transformer",
@@ -328,84 +330,117 @@ class Pipeline:
 
     def _execute_loading(self, context: PipelineContext) -> List[Dict[str, Any]]:
         """Execute loader plugins."""
-        results = []
-
-        for loader_config in context.config.loaders:
-            if not loader_config.enabled:
-                continue
+        loader_configs = [c for c in context.config.loaders if c.enabled]
+        return self._run_stage_plugins(self._run_loader, context, loader_configs)
 
-            try:
-                loader = self.plugin_manager.create_plugin_instance(
+    def _run_stage_plugins(
+        self,
+        run_one: Callable[[PipelineContext, PluginConfig], T],
+        context: PipelineContext,
+        plugin_configs: List[PluginConfig],
+    ) -> List[T]:
+        """Run one stage plugin per config, concurrently when that is safe.
+
+        With parallel_execution enabled, the plugins run on a thread pool.
+        Plugin instances are tracked by name, so plugins can only overlap when
+        each one uses a different plugin; otherwise they run in sequence.
+        Concurrent plugins all run to completion; if any configured with
+        on_error='stop' failed, the first such error in config order is raised.
+
+        Args:
+            run_one: Runs a single plugin config and returns its result
+            context: Pipeline context shared by the plugins
+            plugin_configs: Enabled plugin configs of the stage
+
+        Returns:
+            Results of run_one in config order
+        """
+        plugin_names = {c.plugin for c in plugin_configs}
+        if not (
+            context.config.parallel_execution
+            and len(plugin_configs) > 1
+            and len(plugin_names) == len(plugin_configs)
+        ):
+            return [run_one(context, plugin_config) for plugin_config in plugin_configs]
+
+        max_workers = min(8, len(plugin_configs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(run_one, context, plugin_config)
+                for plugin_config in plugin_configs
+            ]
+            wait(futures)
+
+        # Results are collected in config order; result() re-raises stop errors
+        return [future.result() for future in futures]
+
+    def _run_loader(
+        self, context: PipelineContext, loader_config: PluginConfig
+    ) -> Dict[str, Any]:
+        """Run a single loader plugin and return its load result summary."""
+        try:
+            loader = cast(
+                LoaderPlugin,
+                self.plugin_manager.create_plugin_instance(
                     loader_config.plugin, "loader", loader_config.params
-                )
-
-                self.audit_logger.log_event(
-                    "plugin_start",
-                    context.pipeline_id,
-                    stage="load",
-                    plugin_name=loader_config.plugin,
-                    plugin_type="loader",
-                )
+                ),
+            )
 
-                # Ensure the loader has the load method
-                if not hasattr(loader, "load") or not callable(loader.load):
-                    raise AttributeError(
-                        f"Plugin {loader_config.plugin} does not have a callable 'load' method"
-                    )
+            self.audit_logger.log_event(
+                "plugin_start",
+                context.pipeline_id,
+                stage="load",
+                plugin_name=loader_config.plugin,
+                plugin_type="loader",
+            )
 
-                if context.data is None:
-                    raise ValueError("Cannot load None data")
-                result = loader.load(context.data)
-                results.append(
-                    {
-                        "plugin": loader_config.plugin,
-                        "success": result.success,
-                        "rows_loaded": result.rows_loaded,
-                        "metadata": result.metadata,
-                    }
-                )
+            if context.data is None:
+                raise ValueError("Cannot load None data")
+            result = loader.load(context.data)
 
-                self.audit_logger.log_event(
-                    "plugin_complete",
-                    context.pipeline_id,
-                    stage="load",
-                    plugin_name=loader_config.plugin,
-                    plugin_type="loader",
-                    data={"rows_loaded": result.rows_loaded},
-                )
+            self.audit_logger.log_event(
+                "plugin_complete",
+                context.pipeline_id,
+                stage="load",
+                plugin_name=loader_config.plugin,
+                plugin_type="loader",
+                data={"rows_loaded": result.rows_loaded},
+            )
 
-            except Exception as e:
-                if loader_config.on_error == "stop":
-                    raise
+            return {
+                "plugin": loader_config.plugin,
+                "success": result.success,
+                "rows_loaded": result.rows_loaded,
+                "metadata": result.metadata,
+            }
 
-                results.append(
-                    {"plugin": loader_config.plugin, "success": False, "error": str(e)}
-                )
+        except Exception as e:
+            if loader_config.on_error == "stop":
+                raise
 
-                self.audit_logger.log_event(
-                    "plugin_error",
-                    context.pipeline_id,
-                    stage="load",
-                    plugin_name=loader_config.plugin,
-                    plugin_type="loader",
-                    success=False,
-                    error_message=str(e),
-                )
-            finally:
-                self.plugin_manager.cleanup_plugin_instance(
-                    loader_config.plugin, "loader"
-                )
+            self.audit_logger.log_event(
+                "plugin_error",
+                context.pipeline_id,
+                stage="load",
+                plugin_name=loader_config.plugin,
+                plugin_type="loader",
+                success=False,
+                error_message=str(e),
+            )
 
-        return results
+            return {"plugin": loader_config.plugin, "success": False, "error": str(e)}
+        finally:
+            self.plugin_manager.cleanup_plugin_instance(loader_config.plugin, "loader")
 
     def _get_relevant_issues(
         self, profile_results: List[ProfileResult]
     ) -> List[Dict[str, Any]]:
         """Extract all issues from profiling results."""
-        all_issues = []
-        for result in profile_results:
-            all_issues.extend(result.issues)
-        return all_issues
+        if len(profile_results) == 1:
+            # Single profiler: copy its issue list so transformers that modify
+            # the list they are given cannot alter the profile results
+            return list(profile_results[0].issues)
+        return list(chain.from_iterable(result.issues for result in profile_results))
 
     def _get_user_approval(
         self, suggestions: List[Dict[str, Any]]
@@ -1,17 +1,29 @@
 """Plugin manager for discovering and loading Santiq plugins"""
 
+import functools
 import importlib
 import importlib.metadata
-import importlib.util
 import json
+import logging
 import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
-
-import yaml
-from packaging import version
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from santiq import __version__ as core_full_version
 from santiq.core.exceptions import (
@@ -25,20 +37,162 @@ from santiq.plugins.base.loader import LoaderPlugin
 from santiq.plugins.base.profiler import ProfilerPlugin
 from santiq.plugins.base.transformer import TransformerPlugin
 
+if TYPE_CHECKING:
+    from packaging.version import Version
+
+logger = logging.getLogger(__name__)
+
 PluginType = Union[ExtractorPlugin, ProfilerPlugin, TransformerPlugin, LoaderPlugin]
 PluginClass = Type[PluginType]
 
+# Every plugin type with its base class and the method it must implement.
+# The lookup tables below, and PluginManager.PLUGIN_TYPES, are derived from it.
+_PLUGIN_TYPE_TABLE: Dict[str, Tuple[PluginClass, str]] = {
+    "extractor": (ExtractorPlugin, "extract"),
+    "profiler": (ProfilerPlugin, "profile"),
+    "transformer": (TransformerPlugin, "transform"),
+    "loader": (LoaderPlugin, "load"),
+}
+
+_PLUGIN_TYPE_NAMES = frozenset(_PLUGIN_TYPE_TABLE)
+
+# Method each plugin type must implement, checked once when a plugin is discovered
+_REQUIRED_METHODS = {
+    plugin_type: method for plugin_type, (_, method) in _PLUGIN_TYPE_TABLE.items()
+}
+
+# Entry point group each plugin type is published under
+_ENTRY_POINT_GROUPS = {
+    plugin_type: f"santiq.{plugin_type}s" for plugin_type in _PLUGIN_TYPE_TABLE
+}
+
+
+def _empty_plugin_map() -> Dict[str, List[Dict[str, Any]]]:
+    """Create an empty discovery result keyed by plugin type."""
+    return {plugin_type: [] for plugin_type in _PLUGIN_TYPE_TABLE}
+
+
+def _yaml_safe_loader() -> Any:
+    """Return libyaml's safe loader when PyYAML was built with it.
+
+    Falls back to the pure-Python ``SafeLoader``; both accept the same
+    documents as ``yaml.safe_load``.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_version(version_string: str) -> "Version":
+    """Parse a version string, reusing earlier results for the same string."""
+    from packaging.version import parse
+
+    return parse(version_string)
+
+
+# Serialises local plugin imports, which edit the process-wide sys.modules
+# and sys.path while local directories are scanned concurrently
+_LOCAL_IMPORT_LOCK = threading.Lock()
+
+
+def _module_from_dir(module: ModuleType, module_name: str, directory: Path) -> bool:
+    """Check whether an imported module is the one a plugin directory provides.
+
+    Only the module's own file directly under the directory matches, so a
+    same-named module from a nested plugin directory is not mistaken for it.
+    """
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return False
+    module_path = directory.resolve().joinpath(*module_name.split("."))
+    return Path(module_file).resolve() in (
+        module_path.with_name(f"{module_path.name}.py"),
+        module_path / "__init__.py",
+    )
+
+
+ManifestFingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+# Directories that never hold plugin manifests but can be large
+_SKIPPED_DIRS = frozenset(("__pycache__", "node_modules", "venv", "site-packages"))
+
+
+def _iter_manifests(root: str) -> Iterator["os.DirEntry[str]"]:
+    """Yield the plugin.yml entries under a directory tree.
+
+    Walks with ``os.scandir`` so only manifest hits are materialised. Hidden
+    directories (``.git``, ``.venv`` and the like), virtualenv, bytecode and
+    ``node_modules`` trees, and symlinked directories are not descended into.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Directory entries for every plugin.yml file found
+    """
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (
+                            not entry.name.startswith(".")
+                            and entry.name not in _SKIPPED_DIRS
+                        ):
+                            pending.append(entry.path)
+                    elif entry.name == "plugin.yml" and entry.is_file():
+                        yield entry
+        except OSError:
+            # Unreadable directories are skipped, as rglob does
+            continue
+
+
+def _manifest_fingerprint(plugin_path: Path) -> ManifestFingerprint:
+    """Fingerprint the plugin manifests under a directory.
+
+    Args:
+        plugin_path: Directory to scan for plugin.yml files
+
+    Returns:
+        Sorted tuple of (path, mtime_ns, size) for every manifest found
+    """
+    entries = []
+    for entry in _iter_manifests(str(plugin_path)):
+        stat = entry.stat()
+        entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _decode_stderr(stderr: Optional[bytes]) -> str:
+    """Decode captured subprocess stderr for error messages."""
+    if not stderr:
+        return ""
+    return stderr.decode("utf-8", errors="replace").strip()
+
 
 class PluginManager:
     """Manages plugin discovery, loading and lifecycle"""
 
-    PLUGIN_TYPES = {  # Fixed: was Plugin_Types (inconsistent casing)
-        "extractor": ExtractorPlugin,
-        "profiler": ProfilerPlugin,
-        "transformer": TransformerPlugin,
-        "loader": LoaderPlugin,
+    # Fixed: was Plugin_Types (inconsistent casing)
+    PLUGIN_TYPES: Dict[str, PluginClass] = {
+        plugin_type: base_class
+        for plugin_type, (base_class, _) in _PLUGIN_TYPE_TABLE.items()
     }
 
+    # Discovery results shared by every manager in the process. Entry points
+    # only change when packages are installed, and local plugin directories
+    # are re-scanned only when their manifests change.
+    _entry_point_plugins: ClassVar[Optional[Dict[str, List[Dict[str, Any]]]]] = None
+    _local_plugin_cache: ClassVar[
+        Dict[str, Tuple[ManifestFingerprint, Dict[str, List[Dict[str, Any]]]]]
+    ] = {}
+    # Local plugin modules imported by discovery, mapped to their plugin
+    # directory, so refresh() can drop them and pick up edited code
+    _local_plugin_modules: ClassVar[Dict[str, Path]] = {}
+
     def __init__(
         self,
         local_plugin_dirs: Optional[List[str]] = None,
@@ -52,11 +206,11 @@ class PluginManager:
         """
         self.local_plugin_dirs = local_plugin_dirs or []
         self.external_plugin_config = external_plugin_config
-        self._loaded_plugins: Dict[str, Dict[str, PluginClass]] = {
-            plugin_type: {} for plugin_type in self.PLUGIN_TYPES
-        }
-        self._plugin_instances: Dict[str, PluginType] = {}
+        self._loaded_plugins: Dict[Tuple[str, str], PluginClass] = {}
+        self._plugin_instances: Dict[Tuple[str, str], PluginType] = {}
         self._external_plugins: Dict[str, Dict[str, Any]] = {}
+        # Last discovery result, indexed by type and name for load_plugin
+        self._discovery_index: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
         self._load_external_plugin_config()
 
     def _load_external_plugin_config(self) -> None:
@@ -76,14 +230,18 @@ class PluginManager:
                     break
 
         if self.external_plugin_config and os.path.exists(self.external_plugin_config):
+            import yaml
+
             try:
                 with open(self.external_plugin_config, "r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_yaml_safe_loader())
                     if isinstance(config, dict):
                         self._external_plugins = config.get("plugins", {})
             except Exception as e:
-                print(
-                    f"Warning: Failed to load external plugin config {self.external_plugin_config}: {e}"
+                logger.warning(
+                    "Failed to load external plugin config %s: %s",
+                    self.external_plugin_config,
+                    e,
                 )
 
     def discover_plugins(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -92,41 +250,39 @@ class PluginManager:
         Returns:
             Dictionary mapping plugin types to lists of plugin information
         """
-        plugins: Dict[str, List[Dict[str, Any]]] = {
-            plugin_type: [] for plugin_type in self.PLUGIN_TYPES
-        }
+        plugins = _empty_plugin_map()
 
         # Discover entry point plugins (built-in and installed from PyPI)
-        for plugin_type in self.PLUGIN_TYPES:  # Fixed: was self.Plugin_Types
-            entry_point_group = f"santiq.{plugin_type}s"
-            try:
-                entry_points = importlib.metadata.entry_points().select(
-                    group=entry_point_group
-                )
-                for entry_point in entry_points:
-                    try:
-                        plugin_info = self._get_plugin_info_from_entry_point(
-                            entry_point, plugin_type
-                        )
-                        plugins[plugin_type].append(plugin_info)
-                    except Exception as e:
-                        print(f"Warning: Failed to load plugin {entry_point.name}: {e}")
-            except Exception as e:
-                print(
-                    f"Warning: Failed to discover entry points for {plugin_type}: {e}"
-                )
+        for plugin_type, plugin_list in self._discover_entry_point_plugins().items():
+            plugins[plugin_type].extend(plugin_list)
 
-        # Discover local plugins
-        for plugin_dir in self.local_plugin_dirs:
+        # Discover local plugins; several directories are scanned concurrently
+        # and merged in configuration order
+        local_dirs = list(self.local_plugin_dirs)
+        scans: List["Future[Dict[str, List[Dict[str, Any]]]]"] = []
+        if len(local_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(local_dirs))) as executor:
+                scans = [
+                    executor.submit(self._discover_local_plugins_cached, plugin_dir)
+                    for plugin_dir in local_dirs
+                ]
+
+        for index, plugin_dir in enumerate(local_dirs):
             try:
-                local_plugins = self._discover_local_plugins(plugin_dir)
+                local_plugins = (
+                    scans[index].result()
+                    if scans
+                    else self._discover_local_plugins_cached(plugin_dir)
+                )
                 for plugin_type, plugin_list in local_plugins.items():
                     plugins[plugin_type].extend(plugin_list)
             except PluginLoadError:
                 # Re-raise PluginLoadError to maintain validation behavior
                 raise
             except Exception as e:
-                print(f"Warning: Failed to discover local plugins in {plugin_dir}: {e}")
+                logger.warning(
+                    "Failed to discover local plugins in %s: %s", plugin_dir, e
+                )
 
         # Discover external plugins from configuration
         external_plugins = self._discover_external_plugins()
@@ -135,6 +291,104 @@ class PluginManager:
 
         return plugins
 
+    def refresh(self) -> None:
+        """Drop cached discovery results so the next discovery re-scans.
+
+        Local plugin modules imported by discovery are removed from
+        ``sys.modules`` and this manager forgets its loaded plugin classes, so
+        the next discovery or load re-imports them. Call this after installing
+        or removing plugin packages, or after editing local plugin code
+        without touching its manifest. Plugin instances already created keep
+        their old classes.
+        """
+        PluginManager._entry_point_plugins = None
+        PluginManager._local_plugin_cache.clear()
+        self._discovery_index = None
+        self._loaded_plugins.clear()
+
+        with _LOCAL_IMPORT_LOCK:
+            for module_name, plugin_dir in PluginManager._local_plugin_modules.items():
+                # Package entry points also import their parent packages
+                top_level = module_name.split(".", 1)[0]
+                for name in [
+                    name
+                    for name in sys.modules
+                    if name == top_level or name.startswith(f"{top_level}.")
+                ]:
+                    module_file = getattr(sys.modules[name], "__file__", None)
+                    if module_file and Path(module_file).resolve().is_relative_to(
+                        plugin_dir.resolve()
+                    ):
+                        del sys.modules[name]
+            PluginManager._local_plugin_modules.clear()
+
+    def _discover_entry_point_plugins(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Discover entry point plugins once per process.
+
+        Returns:
+            Dictionary mapping plugin types to lists of plugin information
+        """
+        cached = PluginManager._entry_point_plugins
+        if cached is not None:
+            return cached
+
+        plugins = _empty_plugin_map()
+
+        # entry_points() scans every installed distribution, so it is read
+        # once and then filtered per plugin group
+        try:
+            all_entry_points = importlib.metadata.entry_points()
+        except Exception as e:
+            logger.warning("Failed to read entry points: %s", e)
+            return plugins
+
+        for plugin_type, entry_point_group in _ENTRY_POINT_GROUPS.items():
+            try:
+                entry_points = all_entry_points.select(group=entry_point_group)
+                for entry_point in entry_points:
+                    try:
+                        plugin_info = self._get_plugin_info_from_entry_point(
+                            entry_point, plugin_type
+                        )
+                        plugins[plugin_type].append(plugin_info)
+                    except Exception as e:
+                        logger.warning(
+                            "Failed to load plugin %s: %s", entry_point.name, e
+                        )
+            except Exception as e:
+                logger.warning(
+                    "Failed to discover entry points for %s: %s", plugin_type, e
+                )
+
+        PluginManager._entry_point_plugins = plugins
+        return plugins
+
+    def _discover_local_plugins_cached(
+        self, plugin_dir: str
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Discover local plugins, reusing the last scan while manifests are unchanged.
+
+        Args:
+            plugin_dir: Directory path to search for plugins
+
+        Returns:
+            Dictionary mapping plugin types to lists of plugin information
+        """
+        plugin_path = Path(plugin_dir)
+        if not plugin_path.is_dir():
+            # Let the uncached path report the problem
+            return self._discover_local_plugins(plugin_dir)
+
+        cache_key = str(plugin_path.resolve())
+        fingerprint = _manifest_fingerprint(plugin_path)
+        cached = PluginManager._local_plugin_cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        plugins = self._discover_local_plugins(plugin_dir)
+        PluginManager._local_plugin_cache[cache_key] = (fingerprint, plugins)
+        return plugins
+
     def _get_plugin_info_from_entry_point(
         self, entry_point: importlib.metadata.EntryPoint, plugin_type: str
     ) -> Dict[str, Any]:
@@ -161,6 +415,17 @@ class PluginManager:
                     Exception(f"Plugin must inherit from {expected_base.__name__}"),
                 )
 
+            # Validate that the plugin has its required method
+            required_method = _REQUIRED_METHODS[plugin_type]
+            if not callable(getattr(plugin_class, required_method, None)):
+                raise PluginLoadError(
+                    entry_point.name,
+                    Exception(
+                        f"{plugin_type.capitalize()} plugin must implement "
+                        f"{required_method}() method"
+                    ),
+                )
+
             return {
                 "name": entry_point.name,
                 "class": plugin_class,
@@ -188,46 +453,49 @@ class PluginManager:
         Returns:
             Dictionary mapping plugin types to lists of plugin information
         """
-        plugins: Dict[str, List[Dict[str, Any]]] = {
-            plugin_type: [] for plugin_type in self.PLUGIN_TYPES
-        }
+        # Imported here so startup does not pay for YAML without local plugins
+        import yaml
+
+        loader = _yaml_safe_loader()
+
+        plugins = _empty_plugin_map()
         plugin_path = Path(plugin_dir)
 
         if not plugin_path.exists():
-            print(f"Warning: Plugin directory {plugin_dir} does not exist")
+            logger.warning("Plugin directory %s does not exist", plugin_dir)
             return plugins
 
         if not plugin_path.is_dir():
-            print(f"Warning: {plugin_dir} is not a directory")
+            logger.warning("%s is not a directory", plugin_dir)
             return plugins
 
-        for manifest_file in plugin_path.rglob("plugin.yml"):
+        for manifest_entry in _iter_manifests(plugin_dir):
+            manifest_file = Path(manifest_entry.path)
             try:
-                with open(manifest_file, "r", encoding="utf-8") as f:
-                    manifest = yaml.safe_load(f)
+                manifest = yaml.load(manifest_file.read_bytes(), Loader=loader)
 
                 if not isinstance(manifest, dict):
-                    print(f"Warning: Invalid manifest format in {manifest_file}")
+                    logger.warning("Invalid manifest format in %s", manifest_file)
                     continue
 
                 plugin_info = self._load_local_plugin(manifest_file.parent, manifest)
                 plugin_type = manifest.get("type")
 
-                if plugin_type not in self.PLUGIN_TYPES:
-                    print(
-                        f"Warning: Unknown plugin type '{plugin_type}' in {manifest_file}"
+                if plugin_type not in _PLUGIN_TYPE_NAMES:
+                    logger.warning(
+                        "Unknown plugin type '%s' in %s", plugin_type, manifest_file
                     )
                     continue
 
                 plugins[plugin_type].append(plugin_info)
 
             except yaml.YAMLError as e:
-                print(f"Warning: Failed to parse YAML in {manifest_file}: {e}")
+                logger.warning("Failed to parse YAML in %s: %s", manifest_file, e)
             except PluginLoadError:
                 # Re-raise PluginLoadError to maintain validation behavior
                 raise
             except Exception as e:
-                print(f"Warning: Failed to load local plugin {manifest_file}: {e}")
+                logger.warning("Failed to load local plugin %s: %s", manifest_file, e)
 
         return plugins
 
@@ -255,119 +523,118 @@ class PluginManager:
                 )
 
         plugin_name = manifest["name"]
+        entry_point_str = manifest["entry_point"]
 
-        # Add plugin directory to Python path temporarily
-        plugin_dir_str = str(plugin_dir)
-        path_added = False
+        if ":" not in entry_point_str:
+            raise PluginLoadError(
+                plugin_name,
+                Exception("entry_point must be in format 'module:class'"),
+            )
 
-        try:
-            if plugin_dir_str not in sys.path:
-                sys.path.insert(0, plugin_dir_str)
-                path_added = True
+        module_name, class_name = entry_point_str.split(":", 1)
 
-            entry_point_str = manifest["entry_point"]
+        # Reuse a module already imported from this plugin directory;
+        # a same-named module from elsewhere is dropped and re-imported
+        with _LOCAL_IMPORT_LOCK:
+            module = sys.modules.get(module_name)
+            if module is None or not _module_from_dir(module, module_name, plugin_dir):
+                module = self._import_local_module(plugin_name, plugin_dir, module_name)
+                PluginManager._local_plugin_modules[module_name] = plugin_dir
 
-            if ":" not in entry_point_str:
-                raise PluginLoadError(
-                    plugin_name,
-                    Exception("entry_point must be in format 'module:class'"),
-                )
+        if not hasattr(module, class_name):
+            raise PluginLoadError(
+                plugin_name,
+                Exception(f"Class '{class_name}' not found in module '{module_name}'"),
+            )
 
-            module_name, class_name = entry_point_str.split(":", 1)
+        plugin_class = getattr(module, class_name)
 
-            try:
-                # Check if module already exists and force reload
-                if module_name in sys.modules:
-                    del sys.modules[module_name]
-                module = importlib.import_module(module_name)
-            except ImportError as e:
-                # Try to load the module from the plugin directory
-                try:
-                    module_file = plugin_dir / f"{module_name}.py"
-                    spec = importlib.util.spec_from_file_location(
-                        module_name, module_file
-                    )
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(module)
-                        # Ensure the module is registered in sys.modules
-                        sys.modules[module_name] = module
-                    else:
-                        raise PluginLoadError(plugin_name, e)
-                except Exception as load_error:
-                    raise PluginLoadError(plugin_name, e) from load_error
-
-            if not hasattr(module, class_name):
-                raise PluginLoadError(
-                    plugin_name,
-                    Exception(
-                        f"Class '{class_name}' not found in module '{module_name}'"
-                    ),
-                )
+        # Validate that the plugin inherits from the correct base class
+        plugin_type = manifest["type"]
+        expected_base = self.PLUGIN_TYPES.get(plugin_type)
+        if expected_base is not None and not issubclass(plugin_class, expected_base):
+            raise PluginLoadError(
+                plugin_name,
+                Exception(f"Plugin must inherit from {expected_base.__name__}"),
+            )
 
-            plugin_class = getattr(module, class_name)
+        # Validate that the plugin has its required method
+        required_method = _REQUIRED_METHODS.get(plugin_type)
+        if required_method and not callable(
+            getattr(plugin_class, required_method, None)
+        ):
+            raise PluginLoadError(
+                plugin_name,
+                Exception(
+                    f"{plugin_type.capitalize()} plugin must implement "
+                    f"{required_method}() method"
+                ),
+            )
 
-            # Validate that the plugin inherits from the correct base class
-            plugin_type = manifest["type"]
-            if plugin_type in self.PLUGIN_TYPES:
-                expected_base = self.PLUGIN_TYPES[plugin_type]
-                if not issubclass(plugin_class, expected_base):
-                    raise PluginLoadError(
-                        plugin_name,
-                        Exception(f"Plugin must inherit from {expected_base.__name__}"),
-                    )
+        return {
+            "name": plugin_name,
+            "class": plugin_class,
+            "plugin_name": manifest.get("plugin_name", plugin_name),
+            "version": manifest.get("version", "unknown"),
+            "api_version": manifest.get("api_version", "1.0"),
+            "description": manifest.get("description", ""),
+            "source": "local",
+            "manifest": manifest,
+            "path": str(plugin_dir),
+            "plugin_type": plugin_type,
+        }
 
-            # Validate that the plugin has required methods
-            if plugin_type == "extractor":
-                if not hasattr(plugin_class, "extract") or not callable(
-                    getattr(plugin_class, "extract")
-                ):
-                    raise PluginLoadError(
-                        plugin_name,
-                        Exception("Extractor plugin must implement extract() method"),
-                    )
-            elif plugin_type == "transformer":
-                if not hasattr(plugin_class, "transform") or not callable(
-                    getattr(plugin_class, "transform")
-                ):
-                    raise PluginLoadError(
-                        plugin_name,
-                        Exception(
-                            "Transformer plugin must implement transform() method"
-                        ),
-                    )
-            elif plugin_type == "profiler":
-                if not hasattr(plugin_class, "profile") or not callable(
-                    getattr(plugin_class, "profile")
-                ):
-                    raise PluginLoadError(
-                        plugin_name,
-                        Exception("Profiler plugin must implement profile() method"),
-                    )
-            elif plugin_type == "loader":
-                if not hasattr(plugin_class, "load") or not callable(
-                    getattr(plugin_class, "load")
-                ):
-                    raise PluginLoadError(
-                        plugin_name,
-                        Exception("Loader plugin must implement load() method"),
-                    )
+    def _import_local_module(
+        self, plugin_name: str, plugin_dir: Path, module_name: str
+    ) -> ModuleType:
+        """Import the entry-point module of a local plugin.
 
-            return {
-                "name": plugin_name,
-                "class": plugin_class,
-                "plugin_name": manifest.get("plugin_name", plugin_name),
-                "version": manifest.get("version", "unknown"),
-                "api_version": manifest.get("api_version", "1.0"),
-                "description": manifest.get("description", ""),
-                "source": "local",
-                "manifest": manifest,
-                "path": plugin_dir_str,
-                "plugin_type": plugin_type,
-            }
+        Single-file modules are executed straight from the plugin directory
+        without touching ``sys.path``. Package entry points, and modules whose
+        own imports need their directory on the path, fall back to a regular
+        import with the directory temporarily prepended to ``sys.path``.
+
+        Args:
+            plugin_name: Name of the plugin, used in error reporting
+            plugin_dir: Directory containing the plugin
+            module_name: Module part of the manifest entry point
+
+        Returns:
+            The imported module
+
+        Raises:
+            PluginLoadError: If the module cannot be imported
+        """
+        from importlib.util import module_from_spec, spec_from_file_location
+
+        sys.modules.pop(module_name, None)
 
+        module_file = plugin_dir / f"{module_name}.py"
+        if "." not in module_name and module_file.is_file():
+            spec = spec_from_file_location(module_name, module_file)
+            if spec and spec.loader:
+                module = module_from_spec(spec)
+                sys.modules[module_name] = module
+                try:
+                    spec.loader.exec_module(module)
+                    return module
+                except ImportError:
+                    # Retry below with the plugin directory on sys.path
+                    sys.modules.pop(module_name, None)
+                except BaseException:
+                    # Never leave a half-initialised module behind for reuse
+                    sys.modules.pop(module_name, None)
+                    raise
+
+        plugin_dir_str = str(plugin_dir)
+        path_added = plugin_dir_str not in sys.path
+        if path_added:
+            sys.path.insert(0, plugin_dir_str)
+        try:
+            return importlib.import_module(module_name)
+        except ImportError as e:
+            raise PluginLoadError(plugin_name, e) from e
         finally:
-            # Remove from path if we added it
             if path_added and plugin_dir_str in sys.path:
                 sys.path.remove(plugin_dir_str)
 
@@ -377,16 +644,14 @@ class PluginManager:
         Returns:
             Dictionary mapping plugin types to lists of plugin information
         """
-        plugins: Dict[str, List[Dict[str, Any]]] = {
-            plugin_type: [] for plugin_type in self.PLUGIN_TYPES
-        }
+        plugins = _empty_plugin_map()
 
         for plugin_name, plugin_config in self._external_plugins.items():
             try:
                 plugin_type = plugin_config.get("type")
-                if plugin_type not in self.PLUGIN_TYPES:
-                    print(
-                        f"Warning: Unknown plugin type '{plugin_type}' for {plugin_name}"
+                if plugin_type not in _PLUGIN_TYPE_NAMES:
+                    logger.warning(
+                        "Unknown plugin type '%s' for %s", plugin_type, plugin_name
                     )
                     continue
 
@@ -421,7 +686,9 @@ class PluginManager:
                     plugins[plugin_type].append(plugin_info)
 
             except Exception as e:
-                print(f"Warning: Failed to process external plugin {plugin_name}: {e}")
+                logger.warning(
+                    "Failed to process external plugin %s: %s", plugin_name, e
+                )
 
         return plugins
 
@@ -462,7 +729,7 @@ class PluginManager:
             package_name = plugin_name
 
         try:
-            cmd = [sys.executable, "-m", "pip", "install"]
+            cmd = [sys.executable, "-m", "pip", "install", "--quiet"]
 
             if upgrade:
                 cmd.append("--upgrade")
@@ -472,7 +739,13 @@ class PluginManager:
 
             cmd.append(package_name)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Only stderr is reported on failure, so pip's stdout is discarded
+            subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
+            )
+
+            # Newly installed or removed packages change the entry points
+            self.refresh()
 
             # Reload external plugin configuration
             self._load_external_plugin_config()
@@ -480,10 +753,12 @@ class PluginManager:
             return True
 
         except subprocess.CalledProcessError as e:
-            print(f"Failed to install {package_name}: {e.stderr}")
+            logger.error(
+                "Failed to install %s: %s", package_name, _decode_stderr(e.stderr)
+            )
             return False
         except Exception as e:
-            print(f"Error installing {package_name}: {e}")
+            logger.error("Error installing %s: %s", package_name, e)
             return False
 
     def uninstall_external_plugin(
@@ -502,8 +777,21 @@ class PluginManager:
             package_name = plugin_name
 
         try:
-            cmd = [sys.executable, "-m", "pip", "uninstall", "-y", package_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            cmd = [
+                sys.executable,
+                "-m",
+                "pip",
+                "uninstall",
+                "--quiet",
+                "-y",
+                package_name,
+            ]
+            subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
+            )
+
+            # Newly installed or removed packages change the entry points
+            self.refresh()
 
             # Reload external plugin configuration
             self._load_external_plugin_config()
@@ -511,10 +799,12 @@ class PluginManager:
             return True
 
         except subprocess.CalledProcessError as e:
-            print(f"Failed to uninstall {package_name}: {e.stderr}")
+            logger.error(
+                "Failed to uninstall %s: %s", package_name, _decode_stderr(e.stderr)
+            )
             return False
         except Exception as e:
-            print(f"Error uninstalling {package_name}: {e}")
+            logger.error("Error uninstalling %s: %s", package_name, e)
             return False
 
     def add_external_plugin_config(
@@ -527,6 +817,7 @@ class PluginManager:
             plugin_config: Plugin configuration dictionary
         """
         self._external_plugins[plugin_name] = plugin_config
+        self._discovery_index = None
         self._save_external_plugin_config()
 
     def remove_external_plugin_config(self, plugin_name: str) -> None:
@@ -537,6 +828,7 @@ class PluginManager:
         """
         if plugin_name in self._external_plugins:
             del self._external_plugins[plugin_name]
+            self._discovery_index = None
             self._save_external_plugin_config()
 
     def _save_external_plugin_config(self) -> None:
@@ -549,14 +841,22 @@ class PluginManager:
                 config_dir, "external_plugins.yml"
             )
 
+        # Write to a sibling temp file and swap it in, so an interrupted save
+        # never leaves a truncated config behind
+        temp_path = f"{self.external_plugin_config}.tmp"
         try:
+            import yaml
+
             config_data = {"plugins": self._external_plugins}
-            with open(self.external_plugin_config, "w", encoding="utf-8") as f:
+            with open(temp_path, "w", encoding="utf-8") as f:
                 yaml.dump(
-                    config_data, f, default_flow_style=False, sort_keys=True, indent=2
+                    config_data, f, default_flow_style=False, sort_keys=False, indent=2
                 )
+            os.replace(temp_path, self.external_plugin_config)
         except Exception as e:
-            print(f"Warning: Failed to save external plugin config: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            logger.warning("Failed to save external plugin config: %s", e)
 
     def get_external_plugin_info(self, plugin_name: str) -> Optional[Dict[str, Any]]:
         """Get information about an external plugin.
@@ -592,27 +892,72 @@ class PluginManager:
             PluginNotFoundError: If plugin is not found
             PluginVersionError: If API version is incompatible
         """
-        if plugin_type not in self.PLUGIN_TYPES:
+        if plugin_type not in _PLUGIN_TYPE_NAMES:
             raise PluginError(f"Unknown plugin type: {plugin_type}")
 
         # Check if already loaded
-        if plugin_name in self._loaded_plugins[plugin_type]:
-            return self._loaded_plugins[plugin_type][plugin_name]
+        loaded = self._loaded_plugins.get((plugin_type, plugin_name))
+        if loaded is not None:
+            return loaded
+
+        plugin_info = self._find_plugin_info(plugin_name, plugin_type)
+        if plugin_info is None:
+            raise PluginNotFoundError(plugin_name, plugin_type)
+
+        # Validate API version
+        self._validate_api_version(plugin_info)
+
+        plugin_class = plugin_info["class"]
+        # Type cast to ensure proper typing
+        typed_plugin_class: PluginClass = plugin_class
+        self._loaded_plugins[(plugin_type, plugin_name)] = typed_plugin_class
+        return typed_plugin_class
+
+    def _find_plugin_info(
+        self, plugin_name: str, plugin_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a plugin in the cached discovery index.
+
+        A miss re-discovers once in case the plugin appeared since the last
+        scan; call refresh() to pick up changes to plugins already indexed.
+
+        Args:
+            plugin_name: Name of the plugin
+            plugin_type: Type of plugin
+
+        Returns:
+            Plugin information dictionary if found, None otherwise
+        """
+        if self._discovery_index is not None:
+            plugin_info = self._discovery_index.get(plugin_type, {}).get(plugin_name)
+            if plugin_info is not None:
+                return plugin_info
 
-        # Discover and load
-        plugins = self.discover_plugins()
-        for plugin_info in plugins[plugin_type]:
-            if plugin_info["name"] == plugin_name:
-                # Validate API version
-                self._validate_api_version(plugin_info)
+        self._discovery_index = self._index_plugins(self.discover_plugins())
+        return self._discovery_index.get(plugin_type, {}).get(plugin_name)
 
-                plugin_class = plugin_info["class"]
-                # Type cast to ensure proper typing
-                typed_plugin_class: PluginClass = plugin_class
-                self._loaded_plugins[plugin_type][plugin_name] = typed_plugin_class
-                return typed_plugin_class
+    @staticmethod
+    def _index_plugins(
+        plugins: Dict[str, List[Dict[str, Any]]],
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Index a discovery result by plugin type and name.
 
-        raise PluginNotFoundError(plugin_name, plugin_type)
+        When several plugins share a name, the first one discovered wins.
+
+        Args:
+            plugins: Discovery result to index
+
+        Returns:
+            Dictionary mapping plugin types to plugin information keyed by name
+        """
+        index: Dict[str, Dict[str, Dict[str, Any]]] = {
+            plugin_type: {} for plugin_type in _PLUGIN_TYPE_NAMES
+        }
+        for plugin_type, plugin_list in plugins.items():
+            by_name = index.setdefault(plugin_type, {})
+            for plugin_info in plugin_list:
+                by_name.setdefault(plugin_info["name"], plugin_info)
+        return index
 
     def _validate_api_version(self, plugin_info: Dict[str, Any]) -> None:
         """Validate plugin API version compatibility.
@@ -623,10 +968,13 @@ class PluginManager:
         Raises:
             PluginVersionError: If API version is incompatible
         """
+        # Only needed once a plugin is actually loaded
+        from packaging import version
+
         plugin_api_version = plugin_info.get("api_version", "1.0")
 
         try:
-            plugin_version_parsed = version.parse(plugin_api_version)
+            plugin_version_parsed = _parse_version(plugin_api_version)
 
             # For now, accept any API version 1.x as compatible
             # This allows for future API evolution while maintaining compatibility
@@ -664,9 +1012,11 @@ class PluginManager:
                 if hasattr(instance, "setup") and callable(instance.setup):
                     instance.setup(config)
                 else:
-                    print(f"Warning: Plugin {plugin_name} does not have a setup method")
+                    logger.warning(
+                        "Plugin %s does not have a setup method", plugin_name
+                    )
 
-            instance_key = f"{plugin_type}:{plugin_name}"
+            instance_key = (plugin_type, plugin_name)
             self._plugin_instances[instance_key] = instance
 
             return instance
@@ -686,7 +1036,7 @@ class PluginManager:
         Returns:
             Plugin instance if it exists, None otherwise
         """
-        instance_key = f"{plugin_type}:{plugin_name}"
+        instance_key = (plugin_type, plugin_name)
         return self._plugin_instances.get(instance_key)
 
     def cleanup_plugin_instance(self, plugin_name: str, plugin_type: str) -> None:
@@ -696,7 +1046,7 @@ class PluginManager:
             plugin_name: Name of the plugin
             plugin_type: Type of plugin
         """
-        instance_key = f"{plugin_type}:{plugin_name}"
+        instance_key = (plugin_type, plugin_name)
         if instance_key in self._plugin_instances:
             instance = self._plugin_instances[instance_key]
 
@@ -705,7 +1055,7 @@ class PluginManager:
                 try:
                     instance.teardown()
                 except Exception as e:
-                    print(f"Warning: Error during teardown of {plugin_name}: {e}")
+                    logger.warning("Error during teardown of %s: %s", plugin_name, e)
 
             del self._plugin_instances[instance_key]
 
@@ -714,8 +1064,7 @@ class PluginManager:
         # Create a copy of keys to avoid dict changing during iteration
         instance_keys = list(self._plugin_instances.keys())
 
-        for instance_key in instance_keys:
-            plugin_type, plugin_name = instance_key.split(":", 1)
+        for plugin_type, plugin_name in instance_keys:
             self.cleanup_plugin_instance(plugin_name, plugin_type)
 
     def list_plugins(
@@ -735,7 +1084,7 @@ class PluginManager:
         discovered = self.discover_plugins()
 
         if plugin_type:
-            if plugin_type not in self.PLUGIN_TYPES:
+            if plugin_type not in _PLUGIN_TYPE_NAMES:
                 raise PluginError(f"Unknown plugin type: {plugin_type}")
             return {plugin_type: discovered[plugin_type]}
 
@@ -753,13 +1102,7 @@ class PluginManager:
         Returns:
             Plugin information dictionary if found, None otherwise
         """
-        plugins = self.discover_plugins()
-
-        for plugin_info in plugins.get(plugin_type, []):
-            if plugin_info["name"] == plugin_name:
-                return plugin_info
-
-        return None
+        return self._find_plugin_info(plugin_name, plugin_type)
 
     def is_plugin_loaded(self, plugin_name: str, plugin_type: str) -> bool:
         """Check if a plugin is loaded.
@@ -771,7 +1114,7 @@ class PluginManager:
         Returns:
             True if plugin is loaded, False otherwise
         """
-        return plugin_name in self._loaded_plugins.get(plugin_type, {})
+        return (plugin_type, plugin_name) in self._loaded_plugins
 
     def unload_plugin(self, plugin_name: str, plugin_type: str) -> None:
         """Unload a plugin and cleanup its instances.
@@ -784,5 +1127,4 @@ class PluginManager:
         self.cleanup_plugin_instance(plugin_name, plugin_type)
 
         # Remove from loaded plugins
-        if plugin_type in self._loaded_plugins:
-            self._loaded_plugins[plugin_type].pop(plugin_name, None)
+        self._loaded_plugins.pop((plugin_type, plugin_name), None)
@@ -4,12 +4,61 @@ This plugin extracts data from CSV files using pandas, with support for
 various pandas read_csv parameters and comprehensive error handling.
 """
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional
 
 import pandas as pd
 
 from santiq.plugins.base.extractor import ExtractorPlugin
 
+# Parameters forwarded from the plugin config to pandas read_csv
+_VALID_READ_CSV_PARAMS = frozenset(
+    (
+        "sep",
+        "delimiter",
+        "header",
+        "names",
+        "index_col",
+        "usecols",
+        "dtype",
+        "engine",
+        "converters",
+        "true_values",
+        "false_values",
+        "skipinitialspace",
+        "skiprows",
+        "skipfooter",
+        "nrows",
+        "na_values",
+        "keep_default_na",
+        "na_filter",
+        "skip_blank_lines",
+        "parse_dates",
+        "date_parser",
+        "dayfirst",
+        "cache_dates",
+        "encoding",
+        "compression",
+        "thousands",
+        "decimal",
+        "comment",
+        "lineterminator",
+        "quotechar",
+        "quoting",
+        "doublequote",
+        "escapechar",
+        "low_memory",
+        "memory_map",
+        "dtype_backend",
+    )
+)
+
+# Parquet schema metadata key holding the source file fingerprint
+_CACHE_FINGERPRINT_KEY = b"santiq.source_fingerprint"
+
 
 class CSVExtractor(ExtractorPlugin):
     """CSV extractor plugin for Santiq.
@@ -27,6 +76,14 @@ class CSVExtractor(ExtractorPlugin):
         na_values (list): Values to treat as NaN
         skiprows (int): Number of rows to skip
         nrows (int): Number of rows to read
+        engine (str): Parser engine; 'pyarrow' uses Arrow's multithreaded
+            reader, which is faster on large files but supports fewer options
+        dtype_backend (str): 'pyarrow' to keep columns as Arrow-backed dtypes
+        cache (bool): Store the parsed data as Parquet and reuse it while the
+            file and read options are unchanged; options that are not plain
+            JSON, such as converters, are never cached (default: False)
+        cache_dir (str): Directory for cached Parquet files
+            (default: '~/.santiq/cache')
 
     Example Configuration:
         {
@@ -71,8 +128,6 @@ class CSVExtractor(ExtractorPlugin):
             raise Exception("CSV extractor requires 'path' parameter in configuration")
 
         # Validate that the file exists and is readable
-        import os
-
         if not os.path.exists(str(path)):
             raise Exception(f"Failed to read CSV file '{path}': File not found")
 
@@ -83,16 +138,27 @@ class CSVExtractor(ExtractorPlugin):
         pandas_params = {
             k: v
             for k, v in self.config.items()
-            if k not in ["path"] and k in self._get_valid_pandas_params()
+            if k != "path" and k in _VALID_READ_CSV_PARAMS
         }
 
         # Set sensible defaults for common parameters
         pandas_params.setdefault("encoding", "utf-8")
-        pandas_params.setdefault("low_memory", False)  # Better for large files
+        if pandas_params.get("engine") != "pyarrow":
+            # The pyarrow engine parses in parallel and rejects low_memory
+            pandas_params.setdefault("low_memory", False)  # Better for large files
+
+        cache_file = None
+        if self.config.get("cache", False):
+            cache_file = self._cache_file(str(path), pandas_params)
+        if cache_file is not None:
+            # Taken before parsing, so edits made mid-read miss the cache later
+            fingerprint = self._source_fingerprint(str(path))
+            cached = self._read_cache(cache_file, fingerprint)
+            if cached is not None:
+                return cached
 
         try:
             data = pd.read_csv(str(path), **pandas_params)
-            return data  # type: ignore[no-any-return]
         except UnicodeDecodeError as e:
             # Provide helpful error message for encoding issues
             raise Exception(
@@ -109,49 +175,112 @@ class CSVExtractor(ExtractorPlugin):
         except Exception as e:
             raise Exception(f"Failed to read CSV file '{path}': {e}")
 
-    def _get_valid_pandas_params(self) -> List[str]:
-        """Get list of valid pandas read_csv parameters.
+        if cache_file is not None:
+            self._write_cache(data, cache_file, fingerprint)
+        return data  # type: ignore[no-any-return]
+
+    def _cache_file(self, path: str, pandas_params: Dict[str, Any]) -> Optional[Path]:
+        """Build the cache file path for a CSV file and its read options.
+
+        The key covers only the absolute path and read parameters, so each
+        source keeps a single cache entry that is overwritten when the file
+        changes. Parameters that are not plain JSON (e.g. converter functions)
+        have no stable key across processes and disable caching.
+
+        Args:
+            path: Path to the CSV file
+            pandas_params: Parameters passed to pandas read_csv
+
+        Returns:
+            Path of the Parquet file holding the cached data, or None if the
+            parameters cannot be cached
+        """
+        try:
+            params_key = json.dumps(pandas_params, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
+        key_source = f"{os.path.abspath(path)}|{params_key}"
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        cache_dir = os.path.expanduser(self.config.get("cache_dir", "~/.santiq/cache"))
+        return Path(cache_dir) / f"{key}.parquet"
+
+    def _source_fingerprint(self, path: str) -> str:
+        """Identify the current contents of a CSV file by mtime and size.
+
+        Args:
+            path: Path to the CSV file
+
+        Returns:
+            Fingerprint string stored alongside the cached data
+        """
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _read_cache(self, cache_file: Path, fingerprint: str) -> Optional[pd.DataFrame]:
+        """Read cached data if it was written for the current file contents.
+
+        Args:
+            cache_file: Parquet file holding the cached data
+            fingerprint: Fingerprint of the CSV file as it is now
+
+        Returns:
+            The cached DataFrame, or None on a miss or unreadable cache file
+        """
+        if not cache_file.exists():
+            return None
+
+        import pyarrow.parquet as pq
+
+        try:
+            metadata = pq.read_schema(cache_file).metadata or {}
+            if metadata.get(_CACHE_FINGERPRINT_KEY) != fingerprint.encode("utf-8"):
+                return None
+            return pd.read_parquet(cache_file)
+        except Exception:
+            return None  # Fall back to parsing the CSV again
+
+    def _write_cache(
+        self, data: pd.DataFrame, cache_file: Path, fingerprint: str
+    ) -> None:
+        """Write extracted data to the cache, ignoring failures.
+
+        Replaces any earlier entry for the same file and read options.
+
+        Args:
+            data: DataFrame read from the CSV file
+            cache_file: Target Parquet file
+            fingerprint: Fingerprint of the CSV file the data was read from
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(data)
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    _CACHE_FINGERPRINT_KEY: fingerprint.encode("utf-8"),
+                }
+            )
+            pq.write_table(table, tmp_file)
+            os.replace(tmp_file, cache_file)
+        except Exception:
+            # Caching is best effort; columns Parquet cannot store skip it
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+    def _get_valid_pandas_params(self) -> FrozenSet[str]:
+        """Get the set of valid pandas read_csv parameters.
 
         Returns:
-            List of parameter names that can be passed to pandas read_csv
+            Set of parameter names that can be passed to pandas read_csv
         """
-        return [
-            "sep",
-            "delimiter",
-            "header",
-            "names",
-            "index_col",
-            "usecols",
-            "dtype",
-            "engine",
-            "converters",
-            "true_values",
-            "false_values",
-            "skipinitialspace",
-            "skiprows",
-            "skipfooter",
-            "nrows",
-            "na_values",
-            "keep_default_na",
-            "na_filter",
-            "skip_blank_lines",
-            "parse_dates",
-            "date_parser",
-            "dayfirst",
-            "cache_dates",
-            "encoding",
-            "compression",
-            "thousands",
-            "decimal",
-            "comment",
-            "lineterminator",
-            "quotechar",
-            "quoting",
-            "doublequote",
-            "escapechar",
-            "low_memory",
-            "memory_map",
-        ]
+        return _VALID_READ_CSV_PARAMS
 
     def get_schema_info(self) -> Dict[str, Any]:
         """Get schema information of the CSV file.
@@ -6,12 +6,33 @@ comprehensive error handling.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 import pandas as pd
 
 from santiq.plugins.base.extractor import ExtractorPlugin
 
+# Parameters forwarded from the plugin config to pandas read_json
+_VALID_READ_JSON_PARAMS = frozenset(
+    (
+        "orient",
+        "typ",
+        "dtype",
+        "convert_axes",
+        "convert_dates",
+        "keep_default_dates",
+        "numpy",
+        "precise_float",
+        "date_unit",
+        "encoding",
+        "lines",
+        "chunksize",
+        "compression",
+        "nrows",
+        "storage_options",
+    )
+)
+
 
 class JSONExtractor(ExtractorPlugin):
     """JSON extractor plugin for Santiq.
@@ -101,7 +122,7 @@ class JSONExtractor(ExtractorPlugin):
         pandas_params = {
             k: v
             for k, v in self.config.items()
-            if k not in ["path"] and k in self._get_valid_pandas_params()
+            if k != "path" and k in _VALID_READ_JSON_PARAMS
         }
 
         # Set sensible defaults for common parameters
@@ -128,29 +149,13 @@ class JSONExtractor(ExtractorPlugin):
         except Exception as e:
             raise Exception(f"Failed to read JSON file '{path}': {e}")
 
-    def _get_valid_pandas_params(self) -> List[str]:
-        """Get list of valid pandas read_json parameters.
+    def _get_valid_pandas_params(self) -> FrozenSet[str]:
+        """Get the set of valid pandas read_json parameters.
 
         Returns:
-            List of parameter names that can be passed to pandas read_json
+            Set of parameter names that can be passed to pandas read_json
         """
-        return [
-            "orient",
-            "typ",
-            "dtype",
-            "convert_axes",
-            "convert_dates",
-            "keep_default_dates",
-            "numpy",
-            "precise_float",
-            "date_unit",
-            "encoding",
-            "lines",
-            "chunksize",
-            "compression",
-            "nrows",
-            "storage_options",
-        ]
+        return _VALID_READ_JSON_PARAMS
 
     def get_schema_info(self) -> Dict[str, Any]:
         """Get schema information of the JSON file.
@@ -6,12 +6,36 @@ via append mode and provides comprehensive error handling.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet
 
 import pandas as pd
 
 from santiq.plugins.base.loader import LoaderPlugin, LoadResult
 
+# Parameters forwarded from the plugin config to pandas to_csv
+_VALID_TO_CSV_PARAMS = frozenset(
+    (
+        "sep",
+        "na_rep",
+        "float_format",
+        "columns",
+        "header",
+        "index",
+        "index_label",
+        "mode",
+        "encoding",
+        "compression",
+        "quoting",
+        "quotechar",
+        "line_terminator",
+        "chunksize",
+        "date_format",
+        "doublequote",
+        "escapechar",
+        "decimal",
+    )
+)
+
 
 class CSVLoader(LoaderPlugin):
     """CSV loader plugin for Santiq.
@@ -29,6 +53,10 @@ class CSVLoader(LoaderPlugin):
         mode (str): Write mode ('w' for overwrite, 'a' for append)
         na_rep (str): String representation for NaN values
         float_format (str): Format string for floating point numbers
+        chunksize (int): Rows formatted per write; pandas already batches
+            about 100,000 cells per write when unset
+        engine (str): 'pyarrow' writes with Arrow's multithreaded CSV writer;
+            pandas is used whenever other options need it (default: pandas)
 
     Example Configuration:
         {
@@ -89,7 +117,7 @@ class CSVLoader(LoaderPlugin):
         pandas_params = {
             k: v
             for k, v in self.config.items()
-            if k not in ["path"] and k in self._get_valid_pandas_params()
+            if k != "path" and k in _VALID_TO_CSV_PARAMS
         }
 
         # Set sensible defaults for common parameters
@@ -97,11 +125,15 @@ class CSVLoader(LoaderPlugin):
         pandas_params.setdefault("encoding", "utf-8")
 
         try:
-            data.to_csv(path, **pandas_params)
+            if self.config.get("engine") == "pyarrow" and self._can_write_with_pyarrow(
+                pandas_params
+            ):
+                self._write_with_pyarrow(data, path, pandas_params)
+            else:
+                data.to_csv(path, **pandas_params)
 
-            # Verify file was created and get metadata
-            file_path = Path(path)
-            file_size = file_path.stat().st_size if file_path.exists() else 0
+            # The writers above raise on failure, so the file exists here
+            file_size = Path(path).stat().st_size
 
             return LoadResult(
                 success=True,
@@ -121,32 +153,55 @@ class CSVLoader(LoaderPlugin):
                 metadata={"error": str(e), "output_path": path},
             )
 
-    def _get_valid_pandas_params(self) -> List[str]:
-        """Get list of valid pandas to_csv parameters.
+    def _can_write_with_pyarrow(self, pandas_params: Dict[str, Any]) -> bool:
+        """Check whether Arrow's CSV writer can honour the given options.
+
+        Arrow always writes UTF-8, never writes the index and only
+        overwrites, so any other option falls back to pandas.
+
+        Args:
+            pandas_params: Parameters that would be passed to pandas to_csv
+
+        Returns:
+            True if the data can be written with pyarrow
+        """
+        if set(pandas_params) - {"sep", "header", "index", "encoding", "mode"}:
+            return False
+        return (
+            not pandas_params["index"]
+            and isinstance(pandas_params.get("header", True), bool)
+            and str(pandas_params["encoding"]).lower().replace("_", "-")
+            in ("utf-8", "utf8")
+            and pandas_params.get("mode", "w") == "w"
+        )
+
+    def _write_with_pyarrow(
+        self, data: pd.DataFrame, path: str, pandas_params: Dict[str, Any]
+    ) -> None:
+        """Write data to CSV using Arrow's CSV writer.
+
+        Args:
+            data: DataFrame to write
+            path: Output file path
+            pandas_params: Parameters accepted by _can_write_with_pyarrow
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        write_options = pa_csv.WriteOptions(
+            include_header=pandas_params.get("header", True),
+            delimiter=pandas_params.get("sep", ","),
+        )
+        pa_csv.write_csv(table, path, write_options=write_options)
+
+    def _get_valid_pandas_params(self) -> FrozenSet[str]:
+        """Get the set of valid pandas to_csv parameters.
 
         Returns:
-            List of parameter names that can be passed to pandas to_csv
+            Set of parameter names that can be passed to pandas to_csv
         """
-        return [
-            "sep",
-            "na_rep",
-            "float_format",
-            "columns",
-            "header",
-            "index",
-            "index_label",
-            "mode",
-            "encoding",
-            "compression",
-            "quoting",
-            "quotechar",
-            "line_terminator",
-            "chunksize",
-            "date_format",
-            "doublequote",
-            "escapechar",
-            "decimal",
-        ]
+        return _VALID_TO_CSV_PARAMS
 
     def supports_incremental(self) -> bool:
         """Check if this loader supports incremental loading.
@@ -6,12 +6,29 @@ formats and provides comprehensive error handling.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet
 
 import pandas as pd
 
 from santiq.plugins.base.loader import LoaderPlugin, LoadResult
 
+# Parameters forwarded from the plugin config to pandas to_json
+_VALID_TO_JSON_PARAMS = frozenset(
+    (
+        "orient",
+        "date_format",
+        "double_precision",
+        "force_ascii",
+        "date_unit",
+        "default_handler",
+        "lines",
+        "compression",
+        "index",
+        "indent",
+        "storage_options",
+    )
+)
+
 
 class JSONLoader(LoaderPlugin):
     """JSON loader plugin for Santiq.
@@ -103,7 +120,7 @@ class JSONLoader(LoaderPlugin):
         pandas_params = {
             k: v
             for k, v in self.config.items()
-            if k not in ["path"] and k in self._get_valid_pandas_params()
+            if k != "path" and k in _VALID_TO_JSON_PARAMS
         }
 
         # Set sensible defaults for common parameters
@@ -140,25 +157,13 @@ class JSONLoader(LoaderPlugin):
                 metadata={"error": str(e), "output_path": path},
             )
 
-    def _get_valid_pandas_params(self) -> List[str]:
-        """Get list of valid pandas to_json parameters.
+    def _get_valid_pandas_params(self) -> FrozenSet[str]:
+        """Get the set of valid pandas to_json parameters.
 
         Returns:
-            List of parameter names that can be passed to pandas to_json
+            Set of parameter names that can be passed to pandas to_json
         """
-        return [
-            "orient",
-            "date_format",
-            "double_precision",
-            "force_ascii",
-            "date_unit",
-            "default_handler",
-            "lines",
-            "compression",
-            "index",
-            "indent",
-            "storage_options",
-        ]
+        return _VALID_TO_JSON_PARAMS
 
     def supports_incremental(self) -> bool:
         """Check if this loader supports incremental loading.
@@ -63,7 +63,9 @@ class BasicCleaner(TransformerPlugin):
         Returns:
             TransformResult containing cleaned data and applied fixes
         """
-        cleaned_data = data.copy()
+        # dropna and drop_duplicates return new frames, so the input is only
+        # copied if a column is about to be replaced on it directly
+        cleaned_data = data
         applied_fixes = []
 
         # Drop nulls if configured
@@ -107,6 +109,8 @@ class BasicCleaner(TransformerPlugin):
         type_conversions = self.config.get("convert_types", {})
         for column, target_type in type_conversions.items():
             if column in cleaned_data.columns:
+                if cleaned_data is data:
+                    cleaned_data = data.copy()
                 try:
                     if target_type == "numeric":
                         cleaned_data[column] = pd.to_numeric(
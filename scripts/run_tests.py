@@ -4,32 +4,77 @@ Provides various test execution options for different scenarios.
 """
 
 import argparse
+import importlib.util
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
 
-def run_command(cmd: List[str], description: str = "") -> int:
-    """Run a command and return exit code."""
+def run_command(
+    cmd: List[str], description: str = "", log: Optional[List[str]] = None
+) -> int:
+    """Run a command and return exit code.
+
+    When log is given, output is collected there instead of printed.
+    """
+    emit = print if log is None else log.append
+
     if description:
-        print(f"\n{'='*60}")
-        print(f"Running: {description}")
-        print(f"Command: {' '.join(cmd)}")
-        print("=" * 60)
+        emit(f"\n{'='*60}")
+        emit(f"Running: {description}")
+        emit(f"Command: {' '.join(cmd)}")
+        emit("=" * 60)
 
     try:
-        result = subprocess.run(cmd, check=False)
+        if log is None:
+            result = subprocess.run(cmd, check=False)
+        else:
+            result = subprocess.run(
+                cmd,
+                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+            log.append(result.stdout)
         return result.returncode
     except FileNotFoundError:
-        print(f"Error: Command not found: {cmd[0]}")
+        emit(f"Error: Command not found: {cmd[0]}")
         return 1
 
 
-def run_unit_tests(coverage: bool = True, verbose: bool = False) -> int:
+def _run_captured(check: Callable[..., int]) -> Tuple[int, str]:
+    """Run a check that accepts a log and return its exit code and output."""
+    log: List[str] = []
+    exit_code = check(log=log)
+    return exit_code, "\n".join(log)
+
+
+def _xdist_args(jobs: str) -> List[str]:
+    """Return pytest-xdist arguments for the requested number of workers."""
+    if jobs == "1":
+        return []
+
+    if importlib.util.find_spec("xdist") is None:
+        print("Warning: pytest-xdist not installed, running tests serially")
+        return []
+
+    return ["-n", jobs]
+
+
+def run_unit_tests(
+    coverage: bool = True, verbose: bool = False, jobs: str = "1"
+) -> int:
     """Run unit tests."""
     cmd = ["pytest", "tests/test_core/"]
 
+    # Keep each test module on one worker
+    xdist_args = _xdist_args(jobs)
+    if xdist_args:
+        cmd.extend(xdist_args + ["--dist=loadfile"])
+
     if verbose:
         cmd.append("-v")
 
@@ -39,9 +84,9 @@ def run_unit_tests(coverage: bool = True, verbose: bool = False) -> int:
     return run_command(cmd, "Unit Tests")
 
 
-def run_integration_tests(verbose: bool = False) -> int:
+def run_integration_tests(verbose: bool = False, jobs: str = "1") -> int:
     """Run integration tests."""
-    cmd = ["pytest", "tests/", "-m", "integration"]
+    cmd = ["pytest", "tests/", "-m", "integration"] + _xdist_args(jobs)
 
     if verbose:
         cmd.append("-v")
@@ -49,9 +94,9 @@ def run_integration_tests(verbose: bool = False) -> int:
     return run_command(cmd, "Integration Tests")
 
 
-def run_cli_tests(verbose: bool = False) -> int:
+def run_cli_tests(verbose: bool = False, jobs: str = "1") -> int:
     """Run CLI tests."""
-    cmd = ["pytest", "tests/", "-m", "cli"]
+    cmd = ["pytest", "tests/", "-m", "cli"] + _xdist_args(jobs)
 
     if verbose:
         cmd.append("-v")
@@ -59,9 +104,9 @@ def run_cli_tests(verbose: bool = False) -> int:
     return run_command(cmd, "CLI Tests")
 
 
-def run_compatibility_tests(verbose: bool = False) -> int:
+def run_compatibility_tests(verbose: bool = False, jobs: str = "1") -> int:
     """Run plugin compatibility tests."""
-    cmd = ["pytest", "tests/", "-m", "compatibility"]
+    cmd = ["pytest", "tests/", "-m", "compatibility"] + _xdist_args(jobs)
 
     if verbose:
         cmd.append("-v")
@@ -69,9 +114,9 @@ def run_compatibility_tests(verbose: bool = False) -> int:
     return run_command(cmd, "Plugin Compatibility Tests")
 
 
-def run_github_workflow_tests(verbose: bool = False) -> int:
+def run_github_workflow_tests(verbose: bool = False, jobs: str = "1") -> int:
     """Run GitHub workflow specific tests."""
-    cmd = ["pytest", "tests/test_core/github_workflow_test.py"]
+    cmd = ["pytest", "tests/test_core/github_workflow_test.py"] + _xdist_args(jobs)
 
     if verbose:
         cmd.append("-v")
@@ -79,9 +124,9 @@ def run_github_workflow_tests(verbose: bool = False) -> int:
     return run_command(cmd, "GitHub Workflow Tests")
 
 
-def run_external_plugin_tests(verbose: bool = False) -> int:
+def run_external_plugin_tests(verbose: bool = False, jobs: str = "1") -> int:
     """Run external plugin management tests."""
-    cmd = ["pytest", "tests/", "-m", "external_plugin"]
+    cmd = ["pytest", "tests/", "-m", "external_plugin"] + _xdist_args(jobs)
 
     if verbose:
         cmd.append("-v")
@@ -89,7 +134,7 @@ def run_external_plugin_tests(verbose: bool = False) -> int:
     return run_command(cmd, "External Plugin Management Tests")
 
 
-def run_linting() -> int:
+def run_linting(log: Optional[List[str]] = None) -> int:
     """Run code linting checks."""
     exit_codes = []
 
@@ -98,6 +143,7 @@ def run_linting() -> int:
         run_command(
             ["black", "--check", "--diff", "santiq", "tests"],
             "Black Code Formatting Check",
+            log,
         )
     )
 
@@ -106,18 +152,21 @@ def run_linting() -> int:
         run_command(
             ["isort", "--check-only", "--profile", "black", "santiq", "tests"],
             "Import Sorting Check",
+            log,
         )
     )
 
     # Type checking
     exit_codes.append(
-        run_command(["mypy", "santiq", "--ignore-missing-imports"], "Type Checking")
+        run_command(
+            ["mypy", "santiq", "--ignore-missing-imports"], "Type Checking", log
+        )
     )
 
     return max(exit_codes) if exit_codes else 0
 
 
-def run_security_checks() -> int:
+def run_security_checks(log: Optional[List[str]] = None) -> int:
     """Run security checks."""
     exit_codes = []
 
@@ -125,7 +174,9 @@ def run_security_checks() -> int:
     try:
         exit_codes.append(
             run_command(
-                ["bandit", "-r", "santiq", "-f", "json"], "Security Vulnerability Check"
+                ["bandit", "-r", "santiq", "-f", "json"],
+                "Security Vulnerability Check",
+                log,
             )
         )
     except:
@@ -249,20 +300,41 @@ print("Performance benchmarks completed")
     )
 
 
-def run_all_tests(verbose: bool = False, include_slow: bool = False) -> int:
-    """Run all tests in sequence."""
-    test_functions = [
+def run_all_tests(
+    verbose: bool = False, include_slow: bool = False, jobs: str = "1"
+) -> int:
+    """Run all tests.
+
+    Linting and security checks do not run pytest, so they run in the
+    background while the test suites run one after another; the suites share
+    coverage output files and already spread across CPUs via pytest-xdist.
+    """
+    static_checks = [
         (run_linting, "Code Quality Checks"),
-        (lambda: run_unit_tests(coverage=True, verbose=verbose), "Unit Tests"),
-        (lambda: run_integration_tests(verbose=verbose), "Integration Tests"),
-        (lambda: run_cli_tests(verbose=verbose), "CLI Tests"),
-        (lambda: run_compatibility_tests(verbose=verbose), "Compatibility Tests"),
+        (run_security_checks, "Security Checks"),
+    ]
+    test_functions = [
         (
-            lambda: run_external_plugin_tests(verbose=verbose),
+            lambda: run_unit_tests(coverage=True, verbose=verbose, jobs=jobs),
+            "Unit Tests",
+        ),
+        (
+            lambda: run_integration_tests(verbose=verbose, jobs=jobs),
+            "Integration Tests",
+        ),
+        (lambda: run_cli_tests(verbose=verbose, jobs=jobs), "CLI Tests"),
+        (
+            lambda: run_compatibility_tests(verbose=verbose, jobs=jobs),
+            "Compatibility Tests",
+        ),
+        (
+            lambda: run_external_plugin_tests(verbose=verbose, jobs=jobs),
             "External Plugin Management Tests",
         ),
-        (lambda: run_github_workflow_tests(verbose=verbose), "GitHub Workflow Tests"),
-        (run_security_checks, "Security Checks"),
+        (
+            lambda: run_github_workflow_tests(verbose=verbose, jobs=jobs),
+            "GitHub Workflow Tests",
+        ),
     ]
 
     if include_slow:
@@ -271,13 +343,7 @@ def run_all_tests(verbose: bool = False, include_slow: bool = False) -> int:
     exit_codes = []
     failed_tests = []
 
-    print(f"\n{'='*80}")
-    print("RUNNING COMPREHENSIVE TEST SUITE")
-    print(f"{'='*80}")
-
-    for test_func, description in test_functions:
-        print(f"\n🔄 Starting: {description}")
-        exit_code = test_func()
+    def record(description: str, exit_code: int) -> None:
         exit_codes.append(exit_code)
 
         if exit_code == 0:
@@ -286,6 +352,27 @@ def run_all_tests(verbose: bool = False, include_slow: bool = False) -> int:
             print(f"❌ {description}: FAILED (exit code: {exit_code})")
             failed_tests.append(description)
 
+    print(f"\n{'='*80}")
+    print("RUNNING COMPREHENSIVE TEST SUITE")
+    print(f"{'='*80}")
+
+    with ThreadPoolExecutor(max_workers=len(static_checks)) as executor:
+        static_futures = [
+            (executor.submit(_run_captured, check), description)
+            for check, description in static_checks
+        ]
+
+        for test_func, description in test_functions:
+            print(f"\n🔄 Starting: {description}")
+            record(description, test_func())
+
+        # Background output is printed whole so it does not interleave
+        for future, description in static_futures:
+            exit_code, output = future.result()
+            print(f"\n🔄 Finished: {description}")
+            print(output)
+            record(description, exit_code)
+
     # Summary
     print(f"\n{'='*80}")
     print("TEST SUITE SUMMARY")
@@ -328,6 +415,7 @@ Examples:
   python scripts/run_tests.py --lint                # Run only linting checks
   python scripts/run_tests.py --performance         # Run performance benchmarks
   python scripts/run_tests.py --all --include-slow  # Run all tests including slow ones
+  python scripts/run_tests.py --unit --jobs 1       # Run unit tests without pytest-xdist
         """,
     )
 
@@ -363,6 +451,12 @@ Examples:
     parser.add_argument(
         "--no-coverage", action="store_true", help="Skip coverage reporting"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        default="auto",
+        help="Number of pytest-xdist workers, 'auto' for one per CPU, 1 to run serially",
+    )
 
     args = parser.parse_args()
 
@@ -387,7 +481,9 @@ Examples:
     exit_code = 0
 
     if args.all:
-        exit_code = run_all_tests(verbose=args.verbose, include_slow=args.include_slow)
+        exit_code = run_all_tests(
+            verbose=args.verbose, include_slow=args.include_slow, jobs=args.jobs
+        )
     else:
         # Run individual test types
         if args.lint:
@@ -396,23 +492,39 @@ Examples:
         if args.unit:
             exit_code = max(
                 exit_code,
-                run_unit_tests(coverage=not args.no_coverage, verbose=args.verbose),
+                run_unit_tests(
+                    coverage=not args.no_coverage,
+                    verbose=args.verbose,
+                    jobs=args.jobs,
+                ),
             )
 
         if args.integration:
-            exit_code = max(exit_code, run_integration_tests(verbose=args.verbose))
+            exit_code = max(
+                exit_code, run_integration_tests(verbose=args.verbose, jobs=args.jobs)
+            )
 
         if args.cli:
-            exit_code = max(exit_code, run_cli_tests(verbose=args.verbose))
+            exit_code = max(
+                exit_code, run_cli_tests(verbose=args.verbose, jobs=args.jobs)
+            )
 
         if args.compatibility:
-            exit_code = max(exit_code, run_compatibility_tests(verbose=args.verbose))
+            exit_code = max(
+                exit_code, run_compatibility_tests(verbose=args.verbose, jobs=args.jobs)
+            )
 
         if args.external_plugin:
-            exit_code = max(exit_code, run_external_plugin_tests(verbose=args.verbose))
+            exit_code = max(
+                exit_code,
+                run_external_plugin_tests(verbose=args.verbose, jobs=args.jobs),
+            )
 
         if args.github_workflow:
-            exit_code = max(exit_code, run_github_workflow_tests(verbose=args.verbose))
+            exit_code = max(
+                exit_code,
+                run_github_workflow_tests(verbose=args.verbose, jobs=args.jobs),
+            )
 
         if args.security:
             exit_code = max(exit_code, run_security_checks())
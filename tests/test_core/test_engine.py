@@ -99,3 +99,30 @@ class TestETLEngine:
 
         assert len(recent) <= 3
         assert all(event["event_type"] == "pipeline_start" for event in recent)
+
+    def test_audit_batch_defers_writes(self, etl_engine: ETLEngine):
+        """Test events logged inside a batch are written when it exits."""
+        pipeline_id = str(uuid.uuid4())
+        audit_logger = etl_engine.audit_logger
+
+        with audit_logger.batch():
+            audit_logger.log_event("plugin_start", pipeline_id)
+            audit_logger.log_event("plugin_complete", pipeline_id)
+            assert audit_logger.get_pipeline_events(pipeline_id) == []
+
+        events = audit_logger.get_pipeline_events(pipeline_id)
+        assert [e.event_type for e in events] == ["plugin_start", "plugin_complete"]
+
+    def test_audit_log_returns_raw_event_dicts(self, etl_engine: ETLEngine):
+        """Test audit log entries are returned as stored in the log file."""
+        pipeline_id = str(uuid.uuid4())
+        etl_engine.audit_logger.log_event("pipeline_start", pipeline_id)
+        etl_engine.audit_logger.log_event("pipeline_complete", pipeline_id)
+
+        history = etl_engine.get_audit_log(pipeline_id)
+
+        assert [event["event_type"] for event in history] == [
+            "pipeline_start",
+            "pipeline_complete",
+        ]
+        assert all(isinstance(event["timestamp"], str) for event in history)
@@ -79,6 +79,41 @@ class TestExternalPluginConfiguration:
         assert plugin_info["package"] == "new-package"
         assert plugin_info["type"] == "loader"
 
+    @pytest.mark.external_plugin
+    def test_save_external_plugin_config_replaces_file(self, temp_dir: Path):
+        """Test saving writes the full config and leaves no temp file behind."""
+        config_file = temp_dir / "test_config.yml"
+        plugin_manager = PluginManager(external_plugin_config=str(config_file))
+
+        plugin_manager.add_external_plugin_config(
+            "new_loader", {"package": "new-package", "type": "loader"}
+        )
+
+        with open(config_file) as f:
+            saved = yaml.safe_load(f)
+        assert saved == {
+            "plugins": {"new_loader": {"package": "new-package", "type": "loader"}}
+        }
+        assert not Path(f"{config_file}.tmp").exists()
+
+    @pytest.mark.external_plugin
+    def test_add_external_plugin_config_saves_edited_info(self, temp_dir: Path):
+        """Test re-adding an edited plugin info dict writes the change to disk."""
+        config_file = temp_dir / "test_config.yml"
+        plugin_manager = PluginManager(external_plugin_config=str(config_file))
+        plugin_manager.add_external_plugin_config(
+            "edited_loader", {"package": "old-package", "type": "loader"}
+        )
+
+        info = plugin_manager.get_external_plugin_info("edited_loader")
+        assert info is not None
+        info["package"] = "new-package"
+        plugin_manager.add_external_plugin_config("edited_loader", info)
+
+        with open(config_file) as f:
+            saved = yaml.safe_load(f)
+        assert saved["plugins"]["edited_loader"]["package"] == "new-package"
+
     @pytest.mark.external_plugin
     def test_remove_external_plugin_config(self, temp_dir: Path):
         """Test removing external plugin configuration."""
@@ -1,7 +1,9 @@
 """Tests for extractor plugins."""
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -62,6 +64,77 @@ class TestCSVExtractor:
         assert list(result.columns) == ["id", "name", "age"]
         assert result.loc[0, "name"] == "Alice"
 
+    def test_csv_extractor_pyarrow_engine(self, sample_csv_file: Path):
+        """Test CSV extraction with the pyarrow parser engine."""
+        extractor = CSVExtractor()
+        extractor.setup({"path": str(sample_csv_file), "engine": "pyarrow"})
+
+        data = extractor.extract()
+
+        expected = pd.read_csv(sample_csv_file)
+        assert list(data.columns) == list(expected.columns)
+        assert len(data) == len(expected)
+
+    def test_csv_extractor_cache(self, sample_csv_file: Path, temp_dir: Path):
+        """Test cached extraction is reused until read options change."""
+        cache_dir = temp_dir / "cache"
+        config = {
+            "path": str(sample_csv_file),
+            "cache": True,
+            "cache_dir": str(cache_dir),
+        }
+        extractor = CSVExtractor()
+        extractor.setup(config)
+
+        first = extractor.extract()
+        assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+        with patch("pandas.read_csv") as mock_read_csv:
+            second = extractor.extract()
+        mock_read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(first, second)
+
+        extractor.setup({**config, "nrows": 2})
+        assert len(extractor.extract()) == 2
+        assert len(list(cache_dir.glob("*.parquet"))) == 2
+
+    def test_csv_extractor_cache_replaced_on_edit(self, temp_dir: Path):
+        """Test editing the CSV replaces its cache entry instead of adding one."""
+        csv_file = temp_dir / "data.csv"
+        cache_dir = temp_dir / "cache"
+        extractor = CSVExtractor()
+        extractor.setup(
+            {"path": str(csv_file), "cache": True, "cache_dir": str(cache_dir)}
+        )
+
+        for rows in (1, 2, 3):
+            csv_file.write_text("id\n" + "".join(f"{i}\n" for i in range(rows)))
+            os.utime(csv_file, ns=(rows * 10**9, rows * 10**9))
+            assert len(extractor.extract()) == rows
+
+        assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+    def test_csv_extractor_cache_skips_callable_params(
+        self, sample_csv_file: Path, temp_dir: Path
+    ):
+        """Test read options that are not plain JSON bypass the cache."""
+        cache_dir = temp_dir / "cache"
+        extractor = CSVExtractor()
+        extractor.setup(
+            {
+                "path": str(sample_csv_file),
+                "converters": {"name": str.upper},
+                "cache": True,
+                "cache_dir": str(cache_dir),
+            }
+        )
+
+        data = extractor.extract()
+
+        expected = pd.read_csv(sample_csv_file, converters={"name": str.upper})
+        assert data["name"].tolist() == expected["name"].tolist()
+        assert not cache_dir.exists()
+
     def test_get_schema_info(self, sample_csv_file: Path):
         """Test getting schema information."""
         extractor = CSVExtractor()
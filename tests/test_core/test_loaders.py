@@ -52,6 +52,23 @@ class TestCSVLoader:
         content = output_path.read_text()
         assert ";" in content
 
+    def test_loading_with_pyarrow_engine(
+        self, temp_dir: Path, sample_data: pd.DataFrame
+    ):
+        """Test CSV loading with the pyarrow writer."""
+        output_path = temp_dir / "output.csv"
+
+        loader = CSVLoader()
+        loader.setup({"path": str(output_path), "engine": "pyarrow", "sep": ";"})
+
+        result = loader.load(sample_data)
+
+        assert result.success is True
+        assert result.metadata["file_size_bytes"] > 0
+        loaded_data = pd.read_csv(output_path, sep=";")
+        assert list(loaded_data.columns) == list(sample_data.columns)
+        assert len(loaded_data) == len(sample_data)
+
     def test_loading_missing_directory(self, temp_dir: Path, sample_data: pd.DataFrame):
         """Test loading to a path where parent directory doesn't exist."""
         output_path = temp_dir / "nested" / "subdir" / "output.csv"
@@ -1,5 +1,6 @@
 """Integration tests for complete pipeline execution."""
 
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -9,6 +10,8 @@ import yaml
 
 from santiq.core.config import PipelineConfig
 from santiq.core.engine import ETLEngine
+from santiq.core.pipeline import Pipeline, PipelineContext
+from santiq.plugins.base.profiler import ProfileResult, ProfilerPlugin
 
 
 @pytest.mark.integration
@@ -54,6 +57,115 @@ class TestPipelineExecution:
         output_file = output_dir / "output.csv"
         assert output_file.exists()
 
+    def test_parallel_loaders(self, temp_dir: Path, sample_data: pd.DataFrame):
+        """Test independent loaders run with parallel execution enabled."""
+        input_file = temp_dir / "input.csv"
+        sample_data.to_csv(input_file, index=False)
+
+        config = PipelineConfig(
+            extractor={"plugin": "csv_extractor", "params": {"path": str(input_file)}},
+            loaders=[
+                {"plugin": "csv_loader", "params": {"path": str(temp_dir / "out.csv")}},
+                {
+                    "plugin": "json_loader",
+                    "params": {"path": str(temp_dir / "out.json")},
+                },
+            ],
+            parallel_execution=True,
+        )
+
+        engine = ETLEngine(audit_log_file=str(temp_dir / "audit.jsonl"))
+        result = engine.run_pipeline_from_config(config)
+
+        assert result["success"] is True
+        assert [r["plugin"] for r in result["load_results"]] == [
+            "csv_loader",
+            "json_loader",
+        ]
+        assert all(r["success"] for r in result["load_results"])
+        assert (temp_dir / "out.csv").exists()
+        assert (temp_dir / "out.json").exists()
+
+    def test_parallel_profilers(self, sample_data: pd.DataFrame):
+        """Test concurrent profilers keep results in config order."""
+
+        class SlowProfiler(ProfilerPlugin):
+            def profile(self, data: pd.DataFrame) -> ProfileResult:
+                time.sleep(0.1)
+                return ProfileResult([{"type": "slow_issue"}], {}, [])
+
+        class FastProfiler(ProfilerPlugin):
+            def profile(self, data: pd.DataFrame) -> ProfileResult:
+                return ProfileResult([{"type": "fast_issue"}], {}, [])
+
+        plugin_manager = Mock()
+        plugin_manager.create_plugin_instance.side_effect = lambda name, *_: {
+            "slow_profiler": SlowProfiler,
+            "fast_profiler": FastProfiler,
+        }[name]()
+        pipeline = Pipeline(plugin_manager, Mock(), Mock())
+
+        config = PipelineConfig(
+            extractor={"plugin": "csv_extractor", "params": {}},
+            profilers=[{"plugin": "slow_profiler"}, {"plugin": "fast_profiler"}],
+            loaders=[{"plugin": "csv_loader", "params": {}}],
+            parallel_execution=True,
+        )
+        context = PipelineContext("test", config)
+        context.data = sample_data
+        try:
+            results = pipeline._execute_profiling(context)
+        finally:
+            context.cleanup()
+
+        # The slow profiler finishes last but its result still comes first
+        assert [r.issues[0]["type"] for r in results] == ["slow_issue", "fast_issue"]
+        assert pipeline._get_relevant_issues(results) == [
+            {"type": "slow_issue"},
+            {"type": "fast_issue"},
+        ]
+
+    def test_relevant_issues_do_not_alias_profile_results(self):
+        """Test the issue list handed to transformers is a copy."""
+        pipeline = Pipeline(Mock(), Mock(), Mock())
+        profile_result = ProfileResult([{"type": "null_values"}], {}, [])
+
+        issues = pipeline._get_relevant_issues([profile_result])
+        issues.clear()
+
+        assert profile_result.issues == [{"type": "null_values"}]
+
+    def test_audit_records_config_changes_between_runs(
+        self, temp_dir: Path, sample_data: pd.DataFrame
+    ):
+        """Test each run audits the config as it was when that run started."""
+        first_file = temp_dir / "a.csv"
+        second_file = temp_dir / "b.csv"
+        sample_data.to_csv(first_file, index=False)
+        sample_data.head(3).to_csv(second_file, index=False)
+
+        config = PipelineConfig(
+            extractor={"plugin": "csv_extractor", "params": {"path": str(first_file)}},
+            loaders=[
+                {"plugin": "csv_loader", "params": {"path": str(temp_dir / "out.csv")}}
+            ],
+        )
+        engine = ETLEngine(audit_log_file=str(temp_dir / "audit.jsonl"))
+        engine.run_pipeline_from_config(config)
+
+        config.extractor.params["path"] = str(second_file)
+        result = engine.run_pipeline_from_config(config)
+
+        assert result["rows_processed"] == 3
+        start_events = [
+            e
+            for e in engine.get_audit_log(result["pipeline_id"])
+            if e["event_type"] == "pipeline_start"
+        ]
+        assert start_events[0]["data"]["config"]["extractor"]["params"]["path"] == str(
+            second_file
+        )
+
     def test_pipeline_with_config_file(self, temp_dir: Path, sample_data: pd.DataFrame):
         """Test pipeline execution with config file."""
         # Create input file
@@ -1,6 +1,8 @@
 """Tests for plugin manager functionality."""
 
 import importlib.metadata
+import os
+import sys
 from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
@@ -77,6 +79,249 @@ class TestPluginDiscovery:
         assert local_plugin["version"] == "1.0.0"
         assert local_plugin["description"] == "Test local plugin"
 
+    def test_local_discovery_reused_until_manifest_changes(self, temp_dir: Path):
+        """Test local plugin directories are only re-scanned when manifests change."""
+        plugin_dir = temp_dir / "cached_plugin"
+        plugin_dir.mkdir()
+        manifest_file = plugin_dir / "plugin.yml"
+        manifest_file.write_text(
+            "name: cached_local_plugin\n"
+            "type: extractor\n"
+            "version: 1.0.0\n"
+            "entry_point: cached_plugin:CachedPlugin\n"
+        )
+        (plugin_dir / "cached_plugin.py").write_text(
+            "from santiq.plugins.base.extractor import ExtractorPlugin\n"
+            "import pandas as pd\n"
+            "class CachedPlugin(ExtractorPlugin):\n"
+            "    def extract(self):\n"
+            "        return pd.DataFrame()\n"
+        )
+
+        plugin_manager = PluginManager(local_plugin_dirs=[str(temp_dir)])
+        with patch.object(
+            plugin_manager,
+            "_discover_local_plugins",
+            wraps=plugin_manager._discover_local_plugins,
+        ) as mock_scan:
+            first = plugin_manager.discover_plugins()
+            plugin_manager.discover_plugins()
+            assert mock_scan.call_count == 1
+
+            manifest_file.write_text(
+                manifest_file.read_text().replace("1.0.0", "1.0.1")
+            )
+            plugins = plugin_manager.discover_plugins()
+            assert mock_scan.call_count == 2
+
+        local_plugin = next(
+            p for p in plugins["extractor"] if p["name"] == "cached_local_plugin"
+        )
+        assert local_plugin["version"] == "1.0.1"
+        # The plugin module is reused rather than re-imported on the rescan
+        first_plugin = next(
+            p for p in first["extractor"] if p["name"] == "cached_local_plugin"
+        )
+        assert local_plugin["class"] is first_plugin["class"]
+
+    def test_nested_local_plugins_sharing_module_name(self, temp_dir: Path):
+        """Test nested plugins with the same module name keep their own classes."""
+        outer_dir = temp_dir / "outer"
+        inner_dir = outer_dir / "inner"
+        inner_dir.mkdir(parents=True)
+        for plugin_dir, name in (
+            (outer_dir, "outer_plugin"),
+            (inner_dir, "inner_plugin"),
+        ):
+            (plugin_dir / "plugin.yml").write_text(
+                f"name: {name}\n"
+                "type: extractor\n"
+                "version: 1.0.0\n"
+                "entry_point: shared_util_module:SharedPlugin\n"
+            )
+            (plugin_dir / "shared_util_module.py").write_text(
+                "from santiq.plugins.base.extractor import ExtractorPlugin\n"
+                "import pandas as pd\n"
+                "class SharedPlugin(ExtractorPlugin):\n"
+                f"    ORIGIN = '{name}'\n"
+                "    def extract(self):\n"
+                "        return pd.DataFrame()\n"
+            )
+
+        plugin_manager = PluginManager(local_plugin_dirs=[str(temp_dir)])
+        try:
+            for _ in range(2):
+                plugins = plugin_manager.discover_plugins()
+                origins = {
+                    p["name"]: p["class"].ORIGIN
+                    for p in plugins["extractor"]
+                    if p["name"] in ("outer_plugin", "inner_plugin")
+                }
+                assert origins == {
+                    "outer_plugin": "outer_plugin",
+                    "inner_plugin": "inner_plugin",
+                }
+                plugin_manager.refresh()
+        finally:
+            sys.modules.pop("shared_util_module", None)
+
+    def test_refresh_picks_up_edited_local_plugin_code(self, temp_dir: Path):
+        """Test refresh() re-imports local plugin code edited in place."""
+        plugin_dir = temp_dir / "edited_plugin"
+        plugin_dir.mkdir()
+        (plugin_dir / "plugin.yml").write_text(
+            "name: edited_local_plugin\n"
+            "type: extractor\n"
+            "version: 1.0.0\n"
+            "entry_point: edited_plugin_module:EditedPlugin\n"
+        )
+        module_file = plugin_dir / "edited_plugin_module.py"
+        source = (
+            "from santiq.plugins.base.extractor import ExtractorPlugin\n"
+            "import pandas as pd\n"
+            "class EditedPlugin(ExtractorPlugin):\n"
+            "    VERSION = {version}\n"
+            "    def extract(self):\n"
+            "        return pd.DataFrame()\n"
+        )
+        module_file.write_text(source.format(version=1))
+
+        plugin_manager = PluginManager(local_plugin_dirs=[str(temp_dir)])
+        try:
+            plugin_class = plugin_manager.load_plugin(
+                "edited_local_plugin", "extractor"
+            )
+            assert plugin_class.VERSION == 1
+
+            module_file.write_text(source.format(version=2))
+            # Move the mtime on so a cached bytecode file is not reused
+            stat = module_file.stat()
+            os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            plugin_manager.refresh()
+
+            plugin_class = plugin_manager.load_plugin(
+                "edited_local_plugin", "extractor"
+            )
+            assert plugin_class.VERSION == 2
+            other_manager = PluginManager(local_plugin_dirs=[str(temp_dir)])
+            plugin_class = other_manager.load_plugin("edited_local_plugin", "extractor")
+            assert plugin_class.VERSION == 2
+        finally:
+            sys.modules.pop("edited_plugin_module", None)
+            plugin_manager.refresh()
+
+    def test_local_plugin_recovers_after_import_error(self, temp_dir: Path):
+        """Test a plugin that failed to import is found once its file is fixed."""
+        plugin_dir = temp_dir / "flaky_plugin"
+        plugin_dir.mkdir()
+        (plugin_dir / "plugin.yml").write_text(
+            "name: flaky_local_plugin\n"
+            "type: extractor\n"
+            "version: 1.0.0\n"
+            "entry_point: flaky_plugin_module:FlakyPlugin\n"
+        )
+        module_file = plugin_dir / "flaky_plugin_module.py"
+        module_file.write_text("raise RuntimeError('not ready')\n")
+
+        plugin_manager = PluginManager(local_plugin_dirs=[str(temp_dir)])
+        try:
+            plugins = plugin_manager.discover_plugins()
+            assert "flaky_local_plugin" not in [p["name"] for p in plugins["extractor"]]
+            assert "flaky_plugin_module" not in sys.modules
+
+            module_file.write_text(
+                "from santiq.plugins.base.extractor import ExtractorPlugin\n"
+                "import pandas as pd\n"
+                "class FlakyPlugin(ExtractorPlugin):\n"
+                "    def extract(self):\n"
+                "        return pd.DataFrame()\n"
+            )
+            plugin_manager.refresh()
+            plugins = plugin_manager.discover_plugins()
+            assert "flaky_local_plugin" in [p["name"] for p in plugins["extractor"]]
+        finally:
+            sys.modules.pop("flaky_plugin_module", None)
+            plugin_manager.refresh()
+
+    def test_local_package_plugin_leaves_sys_path_unchanged(self, temp_dir: Path):
+        """Test package-style local plugins load without leaking sys.path edits."""
+        plugin_dir = temp_dir / "package_plugin"
+        (plugin_dir / "pkg_plugin").mkdir(parents=True)
+        (plugin_dir / "plugin.yml").write_text(
+            "name: package_local_plugin\n"
+            "type: extractor\n"
+            "entry_point: pkg_plugin.extractor:PackagePlugin\n"
+        )
+        (plugin_dir / "pkg_plugin" / "__init__.py").write_text("")
+        (plugin_dir / "pkg_plugin" / "extractor.py").write_text(
+            "from santiq.plugins.base.extractor import ExtractorPlugin\n"
+            "import pandas as pd\n"
+            "class PackagePlugin(ExtractorPlugin):\n"
+            "    def extract(self):\n"
+            "        return pd.DataFrame()\n"
+        )
+
+        sys_path_before = list(sys.path)
+        plugin_manager = PluginManager(local_plugin_dirs=[str(temp_dir)])
+        plugins = plugin_manager.discover_plugins()
+
+        assert sys.path == sys_path_before
+        assert any(p["name"] == "package_local_plugin" for p in plugins["extractor"])
+
+    def test_local_discovery_skips_vendor_dirs(self, temp_dir: Path):
+        """Test manifests under hidden and vendored directories are ignored."""
+        for skipped in (".git", "node_modules", "venv"):
+            vendored = temp_dir / skipped / "vendored"
+            vendored.mkdir(parents=True)
+            (vendored / "plugin.yml").write_text(
+                f"name: {skipped.strip('.')}_plugin\n"
+                "type: extractor\n"
+                "entry_point: missing:Missing\n"
+            )
+
+        plugin_manager = PluginManager(local_plugin_dirs=[str(temp_dir)])
+        plugins = plugin_manager.discover_plugins()
+
+        assert not any(p["source"] == "local" for p in plugins["extractor"])
+
+    def test_missing_local_dir_logs_warning(self, temp_dir: Path, caplog):
+        """Test a missing local plugin directory is reported through logging."""
+        missing_dir = temp_dir / "missing"
+        plugin_manager = PluginManager(local_plugin_dirs=[str(missing_dir)])
+
+        with caplog.at_level("WARNING", logger="santiq.core.plugin_manager"):
+            plugin_manager.discover_plugins()
+
+        assert f"Plugin directory {missing_dir} does not exist" in caplog.text
+
+    def test_multiple_local_dirs_merged_in_order(self, temp_dir: Path):
+        """Test plugins from several local directories keep configuration order."""
+        plugin_dirs = []
+        for index in range(3):
+            plugin_dir = temp_dir / f"dir_{index}" / "plugin"
+            plugin_dir.mkdir(parents=True)
+            (plugin_dir / "plugin.yml").write_text(
+                f"name: ordered_plugin_{index}\n"
+                "type: extractor\n"
+                f"entry_point: ordered_{index}:OrderedPlugin\n"
+            )
+            (plugin_dir / f"ordered_{index}.py").write_text(
+                "from santiq.plugins.base.extractor import ExtractorPlugin\n"
+                "import pandas as pd\n"
+                "class OrderedPlugin(ExtractorPlugin):\n"
+                "    def extract(self):\n"
+                "        return pd.DataFrame()\n"
+            )
+            plugin_dirs.append(str(temp_dir / f"dir_{index}"))
+
+        plugin_manager = PluginManager(local_plugin_dirs=plugin_dirs)
+        plugins = plugin_manager.discover_plugins()
+
+        local_names = [
+            p["name"] for p in plugins["extractor"] if p["source"] == "local"
+        ]
+        assert local_names == [f"ordered_plugin_{index}" for index in range(3)]
+
 
 class TestPluginLoading:
     """Test plugin loading functionality."""
@@ -109,6 +354,22 @@ class TestPluginLoading:
 
         assert plugin_class1 is plugin_class2  # Same object (cached)
 
+    def test_discovery_shared_across_plugin_loads(self, plugin_manager: PluginManager):
+        """Test loading different plugins reuses one discovery pass."""
+        with patch.object(
+            plugin_manager,
+            "discover_plugins",
+            wraps=plugin_manager.discover_plugins,
+        ) as mock_discover:
+            plugin_manager.load_plugin("csv_extractor", "extractor")
+            plugin_manager.load_plugin("csv_loader", "loader")
+            assert mock_discover.call_count == 1
+
+            # A miss re-discovers once before giving up
+            with pytest.raises(PluginNotFoundError):
+                plugin_manager.load_plugin("nonexistent_plugin", "extractor")
+            assert mock_discover.call_count == 2
+
 
 class TestPluginInstantiation:
     """Test plugin instance creation and management."""
@@ -112,3 +112,19 @@ class TestBasicProfiler:
         # Should suggest fixes for detected issues
         assert "drop_nulls" in suggestion_types
         assert len([s for s in result.suggestions if s["fix_type"] == "drop_nulls"]) > 0
+
+    def test_memory_usage_estimate(self):
+        """Test the sampled memory estimate stays close to the deep measurement."""
+        data = pd.DataFrame(
+            {
+                "id": range(5000),
+                "name": pd.Series([f"user_{i}" for i in range(5000)], dtype=object),
+            }
+        )
+
+        profiler = BasicProfiler()
+        profiler.setup({})
+        result = profiler.profile(data)
+
+        exact_mb = data.memory_usage(deep=True).sum() / 1024 / 1024
+        assert result.summary["memory_usage_mb"] == pytest.approx(exact_mb, rel=0.1)
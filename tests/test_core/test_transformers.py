@@ -99,6 +99,9 @@ class TestBasicCleaner:
         ]
         assert len(type_fixes) == 3
 
+        # The input frame is left untouched
+        assert data["numeric_string"].tolist() == ["1", "2", "3"]
+
     def test_combined_cleaning(self, problematic_data: pd.DataFrame):
         """Test combined cleaning operations."""
         cleaner = BasicCleaner()